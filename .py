@@ -29,31 +29,35 @@ import pandas as pd
 from src.logger import logger
 from .convertors.dict import dict2ns
 
-def fix_json_string(jjson: str | list) -> str:
+_FIX_RE = re.compile(r'\\n|\\"|\\\\|\\(?=")')
+_FIX_MAP = {'\\n': '\n', '\\"': '"', '\\\\': '\\', '\\': ''}
+
+
+def _fix_one(j: str) -> str:
+    """Correct common formatting issues in a single JSON string."""
+    if '\\' not in j:
+        # Nothing escaped - leave the string untouched
+        return j
+    try:
+        # Escaped newlines, escaped quotes, double backslashes and stray
+        # escapes before quotes are all fixed in a single pass
+        return _FIX_RE.sub(lambda m: _FIX_MAP[m.group(0)], j)
+    except Exception as ex:
+        logger.error(f"Error in string normilizer", ex, True)
+        return j
+
+def fix_json_string(jjson: str | list) -> str | list:
     """Correct common formatting issues in JSON strings.
 
     Args:
-        jjson (str): The raw JSON string that may contain issues.
+        jjson (str | list): The raw JSON string, or a list of them, that may contain issues.
 
     Returns:
-        str: Corrected JSON string.
+        str | list: Corrected JSON string, or a list of corrected strings for list input.
     """
-    jjson_list: list = jjson if isinstance(jjson,list) else [jjson]
-    for j in jjson_list:
-        if isinstance(j, str):
-            try:
-                j = j.replace('\\n', '\n')  # Convert escaped newlines to actual newlines
-                j = j.replace('\\"', '"')   # Remove unnecessary escaping of quotes
-                j = j.replace('\\\\', '\\') # Remove double backslashes
-                j = re.sub(r'\\(?=")', '', j)  # Remove escaping before double quotes if any
-                #return j
-            except Exception as ex:
-                logger.error(f"Error in string normilizer", ex, True)
-                ...
-                continue 
-    if len(jjson_list) == 1:
-        return jjson_list[0]
-    return jjson_list
+    if isinstance(jjson, str):
+        return _fix_one(jjson)
+    return [_fix_one(j) if isinstance(j, str) else j for j in jjson]
 
 def j_dumps(
     data: Dict | SimpleNamespace | List[Dict] | List[SimpleNamespace],
@@ -211,6 +215,8 @@ def clean_string(jjson: str) -> str:
             ...
         ValueError: Empty JSON string provided.
     """
+    if jjson and not jjson[0].isspace() and not jjson[-1].isspace():
+        return jjson  # Строка уже очищена
     cleaned_str = jjson.strip()  # Удаление начальных и конечных пробелов
     if not cleaned_str:
         raise ValueError("Empty JSON string provided.")
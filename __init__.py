@@ -51,21 +51,26 @@ from .csv import (
     read_csv_as_ns,
     read_csv_file,
     save_csv_file,
+    save_csv_file_async,
 )
 
 from .date_time import TimeoutCheck
 
 from .file import (
+    clear_listing_cache,
     get_directory_names,
     get_filenames,
     read_text_file,
     recursive_get_filenames,
     recursive_read_text_files,
     save_text_file,
+    save_text_file_async,
 )
 
 from .image import (
+    save_many_png_from_urls,
     save_png,
+    save_png_from_path,
     save_png_from_url,
 )
 
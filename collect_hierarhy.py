@@ -1,28 +1,74 @@
 ## \file src/utils/collect_hierarhy.py
 """! This script recursively traverses the 'src' directory, collects the file hierarchy, and saves it as a JSON file, excluding specific directories and files, and including only .py, .json, .md, .dot, and .mer files. It also copies the found files to the 'project_structure' directory, maintaining the hierarchy."""
 import header
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from shutil import copy2
+from shutil import copy2, copystat
 from src.utils.jjson import j_dumps
 
-def collect_and_copy_files(directory: Path, target_directory: Path) -> dict:
+EXCLUDED_DIRS = frozenset({'profiles', '__pycache__', '_experiments'})
+INCLUDED_SUFFIXES = frozenset({'py', 'json', 'md', 'dot', 'mer'})
+
+def _fast_copy(src: str, dst: Path) -> None:
+    """! Copy a file inside the kernel with `os.copy_file_range` and keep its metadata like `copy2`.
+    Falls back to `copy2` where `copy_file_range` is unavailable or refused (other OS, old kernel, cross-device copy)
+    or copies nothing at all (procfs/sysfs, some FUSE and overlay filesystems), as `shutil` does for its fast path."""
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            # Read until copy_file_range reports the end: st_size may be 0 or stale for special files
+            blocksize = max(os.fstat(fsrc.fileno()).st_size, 1 << 23)
+            offset = 0
+            while True:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), blocksize)
+                if not copied:
+                    break
+                offset += copied
+    except (AttributeError, OSError):
+        offset = 0
+    if not offset:
+        # Nothing went through the kernel path; a real empty file is copied just as well by copy2
+        copy2(src, dst)
+        return
+    copystat(src, dst)
+
+def collect_and_copy_files(directory: Path | str, target_directory: Path, copy_tasks: list | None = None) -> dict:
+    """! Collect the file hierarchy of `directory` and copy the matching files to `target_directory`.
+    When `copy_tasks` is given, `(source, target)` pairs are appended to it instead of being copied right away."""
     hierarchy = {}
-    for item in directory.iterdir():
-        if item.is_dir():
-            if item.name not in ['profiles', '__pycache__', '_experiments'] and not item.name.startswith('___') and '*' not in item.name:
-                hierarchy[item.name] = collect_and_copy_files(item, target_directory / item.name)
-        else:
-            if (item.suffix in ['.py', '.json', '.md', '.dot', '.mer']) and not item.name.startswith('___') and '*' not in item.name and '(' not in item.name and ')' not in item.name:
-                hierarchy[item.name] = None
-                target_file_path = target_directory / item.name
-                target_file_path.parent.mkdir(parents=True, exist_ok=True)
-                copy2(item, target_file_path)
+    target_created = False
+    # os.scandir exposes the file type read with the directory listing, no extra stat per entry
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            # Name checks first: excluded entries never cost a type lookup. None of the
+            # excluded directory names has a suffix, so they would not match as files either.
+            if name in EXCLUDED_DIRS or name.startswith('___') or '*' in name:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                hierarchy[name] = collect_and_copy_files(entry.path, target_directory / name, copy_tasks)
+            else:
+                stem, dot, suffix = name.rpartition('.')
+                if stem and suffix in INCLUDED_SUFFIXES and '(' not in name and ')' not in name:
+                    hierarchy[name] = None
+                    if not target_created:
+                        # One mkdir per directory, and only for directories that receive files
+                        target_directory.mkdir(parents=True, exist_ok=True)
+                        target_created = True
+                    if copy_tasks is None:
+                        _fast_copy(entry.path, target_directory / name)
+                    else:
+                        copy_tasks.append((entry.path, target_directory / name))
     return hierarchy
 
 def main():
     src_directory = Path(header.__root__ , 'src' , 'utils')
     project_structure_directory = Path(src_directory , 'prod')  # Создаем папку 'prod'
-    file_hierarchy = collect_and_copy_files(src_directory, project_structure_directory)
+    copy_tasks = []
+    file_hierarchy = collect_and_copy_files(src_directory, project_structure_directory, copy_tasks)
+    # The walk stays single-threaded, the independent copies overlap their I/O
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(lambda task: _fast_copy(*task), copy_tasks))
     json_output_path = Path(project_structure_directory, 'file_hierarchy.json')
     j_dumps(file_hierarchy, json_output_path)
 
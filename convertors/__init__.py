@@ -8,71 +8,48 @@
 from packaging.version import Version
 from .version import __version__, __doc__, __details__  
 
-from .csv import (
-                    csv2dict, 
-                    csv2ns,
-                    )
-
-from .dict import ( dict2ns, 
-                    dict2xls, 
-                    dict2xml, 
-                    dict2csv,
-                    dict2html
-                    )
-
-from .html import (
-                    html2escape, 
-                    html2ns, 
-                    html2dict, 
-                    escape2html,
-                    ) 
-
-from .html2text import (
-                    html2text,
-                    html2text_file,
-                    google_fixed_width_font,
-                    google_has_height,
-                    google_list_style,
-                    google_nest_count,
-                    google_text_emphasis,
-                    dumb_css_parser,
-                    dumb_property_dict,
-                    dumb_property_dict,
-                    
-                    )
-from .webp2png import webp2png
-
-from .json import (
-                    json2csv, 
-                   json2ns, 
-                   json2xls, 
-                   json2xml
-                    )
-
-from .ns import (
-                    ns2csv, 
-                    ns2dict, 
-                    ns2json, 
-                    ns2xls, 
-                    ns2xml
-                    )
-
-from .md2dict import (
-                    md2dict, 
-                    
-                      )
-
-from .xls import xls2dict
-from .xml2dict import xml2dict  
-
-from .base64 import (
-                    base64_to_tmpfile,
-                    base64encode,
-                    )
-from .text2png import TextToImageGenerator
-from .tts import (
-                    speech_recognizer, 
-                    text2speech,
-                )
-
-
+import importlib
+
+# Submodules pull in heavy third-party packages (pandas, Pillow, speech and PDF libraries),
+# so each name is imported from its submodule only on first access (PEP 562)
+_LAZY = {
+    '.csv': ('csv2dict', 'csv2ns'),
+    '.dict': ('dict2ns', 'dict2xls', 'dict2xml', 'dict2csv', 'dict2json', 'dict2html'),
+    '.html': ('html2escape', 'html2ns', 'html2dict', 'escape2html'),
+    '.html2text': (
+        'html2text',
+        'html2text_file',
+        'google_fixed_width_font',
+        'google_has_height',
+        'google_list_style',
+        'google_nest_count',
+        'google_text_emphasis',
+        'dumb_css_parser',
+        'dumb_property_dict',
+    ),
+    '.webp2png': ('webp2png', 'webp2png_batch'),
+    '.json': ('json2csv', 'json2ns', 'json2xls', 'json2xml'),
+    '.ns': ('ns2csv', 'ns2dict', 'ns2json', 'ns2xls', 'ns2xml'),
+    '.md2dict': ('md2dict',),
+    '.xls': ('xls2dict',),
+    '.xml2dict': ('xml2dict',),
+    '.base64': ('base64_to_tmpfile', 'base64encode'),
+    '.text2png': ('TextToImageGenerator',),
+    '.tts': ('speech_recognizer', 'text2speech'),
+}
+_LAZY_NAMES = {name: module for module, names in _LAZY.items() for name in names}
+
+__all__ = tuple(_LAZY_NAMES)
+
+
+def __getattr__(name: str):
+    module = _LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -9,9 +9,15 @@ Functions:
     - `base64_to_tmpfile`: Convert Base64 encoded content to a temporary file.
 """
 
-import base64
+import binascii
 import tempfile
 import os
+from functools import lru_cache
+
+@lru_cache(maxsize=256)
+def _ext_of(file_name: str) -> str:
+    """Return the extension of `file_name`; cached for repeated names."""
+    return os.path.splitext(file_name)[1]
 
 def base64_to_tmpfile(content: str, file_name: str) -> str:
     """
@@ -34,10 +40,11 @@ def base64_to_tmpfile(content: str, file_name: str) -> str:
         >>> print(f"Temporary file created at: {tmp_file_path}")
         Temporary file created at: /tmp/tmpfile.txt
     """
-    _, ext = os.path.splitext(file_name)
+    ext = _ext_of(file_name)
     path = ''
     with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as tmp:
-        tmp.write(base64.b64decode(content))
+        # a2b_base64 is what b64decode calls underneath, minus the argument wrapping
+        tmp.write(binascii.a2b_base64(content))
         path = tmp.name
 
     return path
@@ -36,19 +36,34 @@ Functions:
 
 import json
 import csv
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict
 from types import SimpleNamespace
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from src.logger import logger
 from src.utils.csv import read_csv_as_dict, read_csv_as_ns, save_csv_file, read_csv_file
 from src.utils.jjson import j_loads, j_dumps
 
-def csv2dict(csv_file: str | Path, *args, **kwargs) -> dict | None:
+@lru_cache(maxsize=64)
+def _csv2dict_cached(csv_file: str, mtime_ns: int, size: int) -> dict | None:
+    """Read a CSV file. `mtime_ns` and `size` only take part in the cache key, so edited files are re-read."""
+    return read_csv_as_dict(csv_file)
+
+def csv2dict(csv_file: str | Path, *args, cached: bool = False, **kwargs) -> dict | None:
     """
     Convert CSV data to a dictionary.
 
     Args:
         csv_file (str | Path): Path to the CSV file to read.
+        cached (bool, optional): If True, results are served from an LRU cache keyed on path, mtime and size.
+            The cached dictionaries are shared between callers and must not be modified. Defaults to False.
 
     Returns:
         dict | None: Dictionary containing the data from CSV converted to JSON format, or `None` if conversion failed.
@@ -56,6 +71,13 @@ def csv2dict(csv_file: str | Path, *args, **kwargs) -> dict | None:
     Raises:
         Exception: If unable to read CSV.
     """
+    if cached and not args and not kwargs:
+        try:
+            stat = os.stat(csv_file)
+        except OSError:
+            pass  # the uncached call below logs the failure
+        else:
+            return _csv2dict_cached(os.path.abspath(csv_file), stat.st_mtime_ns, stat.st_size)
     return read_csv_as_dict(csv_file, *args, **kwargs)
 
 def csv2ns(csv_file: str | Path, *args, **kwargs) -> SimpleNamespace | None:
@@ -96,8 +118,13 @@ def csv_to_json(
     try:
         data = read_csv_file(csv_file_path, exc_info=exc_info)
         if data is not None:
-            with open(json_file_path, 'w', encoding='utf-8') as jsonfile:
-                json.dump(data, jsonfile, indent=4)
+            if orjson:
+                # orjson only offers two-space indentation and writes UTF-8 bytes directly
+                with open(json_file_path, 'wb') as jsonfile:
+                    jsonfile.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(json_file_path, 'w', encoding='utf-8', buffering=1 << 20) as jsonfile:
+                    json.dump(data, jsonfile, indent=4)
             return data
         return
     except Exception as ex:
@@ -19,13 +19,21 @@ Functions:
 
 
 import json
+import struct
+from io import StringIO
 from types import SimpleNamespace
 from typing import Any, Dict, List
 from pathlib import Path
-from xml.dom.minidom import getDOMImplementation
+from xml.etree.ElementTree import Element, SubElement
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
 from src.utils.xls import save_xls_file
+from src.logger import logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # def dict2ns(data: Dict[str, Any] | List[Any]) -> Any:
 #     """
@@ -82,26 +90,80 @@ def dict2pdf(data: dict | SimpleNamespace, file_path: str | Path) -> None:
 
     pdf.save()
 
-def dict2ns(data: Dict[str, Any] | List[Any]) -> Any:
+_SHAREABLE_TYPES = frozenset({str, int, bool, float, type(None)})
+
+def dict2ns(data: Dict[str, Any] | List[Any], share_equal: bool = False) -> Any:
     """
-    Recursively convert dictionaries to SimpleNamespace.
+    Convert dictionaries to SimpleNamespace at every nesting level.
+
+    The tree is walked with an explicit stack, so deeply nested data does not hit the recursion limit.
+    The input is left unchanged. A dict object that occurs several times converts to one shared namespace.
 
     Args:
         data (Dict[str, Any] | List[Any]): The data to convert.
+        share_equal (bool, optional): Convert identical flat dictionaries (string keys; str, int, bool, float or None
+            values only) into one shared SimpleNamespace instead of one per occurrence. Changing an attribute of a shared namespace is
+            visible at every place it occurs. Defaults to False.
 
     Returns:
         Any: Converted data as a SimpleNamespace or a list of SimpleNamespace.
     """
-    if isinstance(data, dict):
-        for key, value in data.items():
+    if not isinstance(data, (dict, list)):
+        return data
+
+    def shared_ns(value: dict) -> SimpleNamespace | None:
+        """Return the namespace shared by all flat dictionaries identical to `value`, or None if it cannot be shared."""
+        fingerprint = []
+        for k, v in value.items():
+            # Exact types only: equal but different values (1, 1.0 and True; (1,) and (1.0,); subclasses with
+            # their own __eq__) must not share a namespace, so containers and other types are never shared
+            value_type = type(v)
+            if type(k) is not str or value_type not in _SHAREABLE_TYPES:
+                return None
+            # Floats by their bits: 0.0 == -0.0, and NaN never equals itself
+            fingerprint.append((k, value_type, struct.pack('<d', v) if value_type is float else v))
+        fingerprint = tuple(fingerprint)
+        ns = shared.get(fingerprint)
+        if ns is None:
+            ns = shared[fingerprint] = SimpleNamespace()
+            ns.__dict__.update(value)
+        return ns
+
+    def namespace_for(value: dict) -> SimpleNamespace:
+        """Return the namespace for a dict, creating it and scheduling its conversion on first sight."""
+        ns = converted.get(id(value))
+        if ns is None:
+            ns = shared_ns(value) if share_equal else None
+            if ns is None:
+                ns = SimpleNamespace()
+                stack.append((value, ns))
+            converted[id(value)] = ns
+        return ns
+
+    shared: dict = {}
+    # Keyed by id() of the source dict: a dict object reached more than once (shared sub-trees,
+    # cycles) is converted once and every occurrence gets the same namespace, as deepcopy does
+    converted: dict = {}
+    stack = []
+
+    if isinstance(data, list):
+        root = [namespace_for(item) if isinstance(item, dict) else item for item in data]
+    else:
+        root = namespace_for(data)
+
+    # Namespaces are created before their children are converted. Each one gets a shallow copy
+    # of its dict, and converted children replace values in that copy, so the input is never modified.
+    # SimpleNamespace.__dict__ is read-only, so a single C-level update fills it instead
+    while stack:
+        current, ns = stack.pop()
+        attrs = ns.__dict__
+        attrs.update(current)
+        for key, value in current.items():
             if isinstance(value, dict):
-                data[key] = dict2ns(value)
+                attrs[key] = namespace_for(value)
             elif isinstance(value, list):
-                data[key] = [dict2ns(item) if isinstance(item, dict) else item for item in value]
-        return SimpleNamespace(**data)
-    elif isinstance(data, list):
-        return [dict2ns(item) if isinstance(item, dict) else item for item in data]
-    return data
+                attrs[key] = [namespace_for(item) if isinstance(item, dict) else item for item in value]
+    return root
 
 def dict2xml(data: Dict[str, Any], encoding: str = 'UTF-8') -> str:
     """
@@ -117,72 +179,55 @@ def dict2xml(data: Dict[str, Any], encoding: str = 'UTF-8') -> str:
     Raises:
         Exception: If more than one root node is provided.
     """
-    def _process_simple(doc, tag, tag_value):
+    def _process_simple(parent, tag, tag_value):
         """
         Generate a node for simple types (int, str).
 
         Args:
-            doc (xml.dom.minidom.Document): XML document object.
+            parent (xml.etree.ElementTree.Element): Element the node is appended to.
             tag (str): Tag name for the XML element.
             tag_value (Any): Value of the tag.
 
         Returns:
-            xml.dom.minidom.Element: Node representing the tag and value.
+            xml.etree.ElementTree.Element: Node representing the tag and value.
         """
-        node = doc.createElement(tag)
-        node.appendChild(doc.createTextNode(str(tag_value)))
+        node = SubElement(parent, tag)
+        node.text = str(tag_value)
         return node
 
-    def _process_attr(doc, attr_value: Dict[str, Any]):
+    def _process_attr(node, attr_value: Dict[str, Any]):
         """
-        Generate attributes for an XML element.
+        Set attributes on an XML element.
 
         Args:
-            doc (xml.dom.minidom.Document): XML document object.
+            node (xml.etree.ElementTree.Element): Element receiving the attributes.
             attr_value (Dict[str, Any]): Dictionary of attributes.
-
-        Returns:
-            List[xml.dom.minidom.Attr]: List of attributes for the XML element.
         """
-        attrs = []
         for attr_name, value in attr_value.items():
-            attr = doc.createAttribute(attr_name)
-            attr.nodeValue = value if not isinstance(value, dict) else value.get('value', '')
-            attrs.append(attr)
-        return attrs
+            node.set(attr_name, value if not isinstance(value, dict) else value.get('value', ''))
 
-    def _process_complex(doc, children):
+    def _process_complex(node, children):
         """
-        Generate nodes for complex types like lists or dicts.
+        Generate child nodes and attributes of an element from tag-value pairs.
 
         Args:
-            doc (xml.dom.minidom.Document): XML document object.
-            children (List[Tuple[str, Any]]): List of tag-value pairs.
-
-        Returns:
-            Tuple[List[xml.dom.minidom.Element], List[xml.dom.minidom.Attr]]: List of child nodes and attributes.
+            node (xml.etree.ElementTree.Element): Element the children are appended to.
+            children (Iterable[Tuple[str, Any]]): Tag-value pairs; the `attrs` tag holds the element attributes.
         """
-        nodelist = []
-        attrs = []
         for tag, value in children:
             if tag == 'attrs':
-                attrs = _process_attr(doc, value)
+                _process_attr(node, value)
             else:
-                nodes = _process(doc, tag, value)
-                nodelist.extend(nodes if isinstance(nodes, list) else [nodes])
-        return nodelist, attrs
+                _process(node, tag, value)
 
-    def _process(doc, tag, tag_value):
+    def _process(parent, tag, tag_value):
         """
-        Generate XML DOM object for a tag and its value.
+        Append the XML element(s) for a tag and its value to `parent`.
 
         Args:
-            doc (xml.dom.minidom.Document): XML document object.
+            parent (xml.etree.ElementTree.Element): Element the new nodes are appended to.
             tag (str): Tag name for the XML element.
-            tag_value (Any): Value of the tag.
-
-        Returns:
-            xml.dom.minidom.Element | List[xml.dom.minidom.Element]: Node or list of nodes for the tag and value.
+            tag_value (Any): Value of the tag. A list produces one element per item.
         """
         if isinstance(tag_value, dict) and list(tag_value.keys()) == ['value']:
             tag_value = tag_value['value']
@@ -191,27 +236,68 @@ def dict2xml(data: Dict[str, Any], encoding: str = 'UTF-8') -> str:
             tag_value = ''
 
         if isinstance(tag_value, (float, int, str)):
-            return _process_simple(doc, tag, tag_value)
+            _process_simple(parent, tag, tag_value)
 
-        if isinstance(tag_value, list):
-            return _process_complex(doc, [(tag, x) for x in tag_value])[0]
+        elif isinstance(tag_value, list):
+            for item in tag_value:
+                _process(parent, tag, item)
 
-        if isinstance(tag_value, dict):
-            node = doc.createElement(tag)
-            nodelist, attrs = _process_complex(doc, tag_value.items())
-            for child in nodelist:
-                node.appendChild(child)
-            for attr in attrs:
-                node.setAttributeNode(attr)
-            return node
+        elif isinstance(tag_value, dict):
+            _process_complex(SubElement(parent, tag), tag_value.items())
+
+    def _escape(data):
+        """
+        Escape text and attribute values the way minidom's toxml() does.
+
+        Args:
+            data (str): Text node or attribute value.
+
+        Returns:
+            str: `&`, `<`, `"` and `>` replaced by entities; newlines are kept as they are.
+        """
+        if not data:
+            return ''
+        return data.replace('&', '&amp;').replace('<', '&lt;').replace('"', '&quot;').replace('>', '&gt;')
+
+    def _serialize(node, write):
+        """
+        Write an element in minidom's toxml() form.
+
+        Args:
+            node (xml.etree.ElementTree.Element): Element to serialize.
+            write (Callable[[str], Any]): Receives the output pieces.
+        """
+        write('<' + node.tag)
+        for attr_name, value in node.items():
+            write(f' {attr_name}="{_escape(value)}"')
+        # minidom writes <tag/> only for elements without any child node; an empty text node still gives <tag></tag>
+        if node.text is None and not len(node):
+            write('/>')
+            return
+        write('>')
+        if node.text is not None:
+            write(_escape(node.text))
+        for child in node:
+            _serialize(child, write)
+        write(f'</{node.tag}>')
 
-    doc = getDOMImplementation().createDocument(None, None, None)
     if len(data) > 1:
         raise Exception('Only one root node allowed')
-    
-    root, _ = _process_complex(doc, data.items())
-    doc.appendChild(root[0])
-    return doc.toxml(encoding)
+
+    # ElementTree builds plain C-level elements instead of minidom's Python node objects.
+    # Only the first element of a list-valued root ends up in the document, so building stops there
+    root_tag, root_value = next(iter(data.items()))
+    container = Element('container')
+    # An item may produce no element (an empty nested list), so `[[], 0]` gives <root>0</root>
+    for item in (root_value if isinstance(root_value, list) else [root_value]):
+        _process(container, root_tag, item)
+        if len(container):
+            break
+    # ElementTree's own serializer differs from minidom's toxml() in empty elements and escaping, so write the tree by hand
+    parts = [f'<?xml version="1.0" encoding="{encoding}"?>' if encoding else '<?xml version="1.0" ?>']
+    _serialize(container[0], parts.append)
+    xml = ''.join(parts)
+    return xml.encode(encoding, 'xmlcharrefreplace') if encoding else xml
 
 def dict2csv(data: dict | SimpleNamespace, file_path: str | Path) -> bool:
     """
@@ -226,6 +312,42 @@ def dict2csv(data: dict | SimpleNamespace, file_path: str | Path) -> bool:
     """
     return save_csv_file(data, file_path)
 
+def _ns_to_dict(obj: Any) -> dict:
+    """JSON encoder hook: nested SimpleNamespace objects are written as their attribute dictionaries."""
+    if isinstance(obj, SimpleNamespace):
+        return vars(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dict2json(data: dict | SimpleNamespace, file_path: str | Path) -> bool:
+    """
+    Save dictionary or SimpleNamespace data to a JSON file.
+
+    The document is encoded straight into the file (orjson when installed), without building a JSON string first.
+
+    Args:
+        data (dict | SimpleNamespace): The data to save to a JSON file.
+        file_path (str | Path): Path to the JSON file.
+
+    Returns:
+        bool: True if the file was saved successfully, False otherwise.
+    """
+    try:
+        if orjson:
+            try:
+                payload = orjson.dumps(data, default=_ns_to_dict, option=orjson.OPT_NON_STR_KEYS)
+            except orjson.JSONEncodeError:
+                payload = None  # e.g. integers wider than 64 bits - let the stdlib handle them
+            if payload is not None:
+                with open(file_path, 'wb') as fp:
+                    fp.write(payload)
+                return True
+        with open(file_path, 'w', encoding='utf-8') as fp:
+            json.dump(data, fp, ensure_ascii=False, default=_ns_to_dict)
+        return True
+    except Exception as ex:
+        logger.error(f"Failed to save JSON to {file_path}", exc_info=True)
+        return False
+
 def dict2xls(data: dict | SimpleNamespace, file_path: str | Path) -> bool:
     """
     Save dictionary or SimpleNamespace data to an XLS file.
@@ -250,46 +372,47 @@ def dict2html(data: dict | SimpleNamespace, encoding: str = 'UTF-8') -> str:
     Returns:
         str: The HTML string representing the input dictionary.
     """
-    def dict_to_html_table(data: dict, depth: int = 0) -> str:
+    def dict_to_html_table(buf: StringIO, data: dict, depth: int = 0) -> None:
         """
-        Recursively convert dictionary to HTML table.
+        Recursively write a dictionary as an HTML table into `buf`.
 
         Args:
+            buf (StringIO): Buffer receiving the HTML; nested tables are written into the same buffer.
             data (dict): The dictionary data to convert.
             depth (int, optional): The depth of recursion, used for nested tables. Defaults to 0.
-
-        Returns:
-            str: The HTML table as a string.
         """
-        html = ['<table border="1" cellpadding="5" cellspacing="0">']
-        
+        write = buf.write
+        write('<table border="1" cellpadding="5" cellspacing="0">')
+
         if isinstance(data, dict):
             for key, value in data.items():
-                html.append('<tr>')
-                html.append(f'<td><strong>{key}</strong></td>')
+                write(f'\n<tr>\n<td><strong>{key}</strong></td>')
                 if isinstance(value, dict):
-                    html.append(f'<td>{dict_to_html_table(value, depth + 1)}</td>')
+                    write('\n<td>')
+                    dict_to_html_table(buf, value, depth + 1)
+                    write('</td>')
                 elif isinstance(value, list):
-                    html.append('<td>')
-                    html.append('<ul>')
+                    write('\n<td>\n<ul>')
                     for item in value:
-                        html.append(f'<li>{item}</li>')
-                    html.append('</ul>')
-                    html.append('</td>')
+                        write(f'\n<li>{item}</li>')
+                    write('\n</ul>\n</td>')
                 else:
-                    html.append(f'<td>{value}</td>')
-                html.append('</tr>')
+                    write(f'\n<td>{value}</td>')
+                write('\n</tr>')
         else:
-            html.append(f'<tr><td colspan="2">{data}</td></tr>')
-        
-        html.append('</table>')
-        return '\n'.join(html)
-    
+            write(f'\n<tr><td colspan="2">{data}</td></tr>')
+
+        write('\n</table>')
+
     # Convert data to dictionary if it's a SimpleNamespace
     if isinstance(data, SimpleNamespace):
         data = data.__dict__
-    
-    html_content = dict_to_html_table(data)
-    return f'<!DOCTYPE html>\n<html>\n<head>\n<meta charset="{encoding}">\n<title>Dictionary to HTML</title>\n</head>\n<body>\n{html_content}\n</body>\n</html>'
+
+    # One buffer for the whole document instead of a list of lines per table joined at every level
+    buf = StringIO()
+    buf.write(f'<!DOCTYPE html>\n<html>\n<head>\n<meta charset="{encoding}">\n<title>Dictionary to HTML</title>\n</head>\n<body>\n')
+    dict_to_html_table(buf, data)
+    buf.write('\n</body>\n</html>')
+    return buf.getvalue()
 
 
@@ -5,11 +5,16 @@
 
 import header 
 
+import json
 import re
 from typing import Dict
 from markdown2 import markdown
 from src.logger import logger
+from src.utils.jjson import extract_json_from_string
 
+# Compiled once: the heading tag at the start of a line, and any tag to strip from the text
+_HEADING_RE = re.compile(r'<h(\d)')
+_TAG_RE = re.compile(r'<[^>]*>')
 
 
 
@@ -23,29 +28,39 @@ def md2dict(md_string: str) -> Dict:
         Dict: A structured representation of the Markdown content.
     """
     try:
-        # Extract JSON from Markdown if present
-        json_content = extract_json_from_string(md_string)
-        if json_content:
-            return {"json": json_content}
+        # A bare JSON document needs no Markdown conversion at all
+        stripped = md_string.strip()
+        if stripped[:1] in ('{', '['):
+            try:
+                json.loads(stripped)
+                return {"json": stripped}
+            except ValueError:
+                ...  # not JSON after all, treat it as Markdown
+
+        # Extract JSON from Markdown if present; without a fence there is nothing to search for
+        if '```' in md_string:
+            json_content = extract_json_from_string(md_string)
+            if json_content:
+                return {"json": json_content}
 
         # If no JSON, process the Markdown normally
         html = markdown(md_string)
         sections = {}
         current_section = None
+        current_items = None
 
         for line in html.splitlines():
-            if line.startswith('<h'):
-                heading_level = int(re.search(r'h(\d)', line).group(1))
-                section_title = re.sub(r'<.*?>', '', line).strip()
+            heading = _HEADING_RE.match(line)
+            if heading:
+                section_title = _TAG_RE.sub('', line).strip()
 
-                if heading_level == 1:
+                if heading.group(1) == '1':
                     current_section = section_title
-                    sections[current_section] = []
+                    current_items = sections[current_section] = []
                 elif current_section:
-                    sections[current_section].append(section_title)
-            elif line.strip() and current_section:
-                clean_text = re.sub(r'<.*?>', '', line).strip()
-                sections[current_section].append(clean_text)
+                    current_items.append(section_title)
+            elif current_section and line.strip():
+                current_items.append(_TAG_RE.sub('', line).strip())
 
         return sections
 
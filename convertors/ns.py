@@ -29,13 +29,45 @@ def ns2dict(ns_obj: SimpleNamespace) -> dict:
     """
     Convert SimpleNamespace object to a dictionary.
 
+    Nested SimpleNamespace objects, dictionaries and lists are converted as well, in a single pass
+    with an explicit stack, so the result can go straight to a JSON or CSV writer.
+    The source objects are not modified. An object reached more than once, including through a cycle,
+    is converted once and every occurrence gets the same result, as `copy.deepcopy` does.
+
     Args:
         ns_obj (SimpleNamespace): The SimpleNamespace object to convert.
 
     Returns:
         dict: Converted dictionary.
     """
-    return vars(ns_obj)
+    stack = []
+    # Keyed by id() of the source container; without it a self-referencing object would get new shells forever
+    converted = {}
+
+    def shell(value):
+        """Return the container for `value`, creating it and scheduling its items on first sight, or `value` itself for scalars."""
+        if isinstance(value, SimpleNamespace):
+            value = vars(value)
+        if isinstance(value, (dict, list)):
+            target = converted.get(id(value))
+            if target is not None:
+                return target
+            if isinstance(value, dict):
+                target = {}
+                stack.append((value.items(), target))
+            else:
+                target = list(value)
+                stack.append((enumerate(value), target))
+            converted[id(value)] = target
+            return target
+        return value
+
+    root = shell(ns_obj)
+    while stack:
+        items, target = stack.pop()
+        for key, value in items:
+            target[key] = shell(value)
+    return root
 
 
 def ns2json(ns_obj: SimpleNamespace, json_file_path: str | Path = None) -> str | bool:
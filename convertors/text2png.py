@@ -7,6 +7,7 @@ This module reads text from a file, generates PNG images for each line of text u
 and saves them to an output directory with customizable options for image appearance.
 """
 
+import asyncio
 from pathlib import Path
 from typing import List, Tuple
 from PIL import Image, ImageDraw, ImageFont
@@ -80,6 +81,8 @@ class TextToImageGenerator:
             [PosixPath('./output/Text 1.png'), PosixPath('./output/Text 2.png'), PosixPath('./output/Text 3.png')]
         """
         output_directory = Path(output_dir) if output_dir else self.default_output_dir
+        # One idempotent mkdir for the batch; the per-image save reports any filesystem error
+        output_directory.mkdir(parents=True, exist_ok=True)
         self.setup_logging(level=log_level)
 
         if not canvas_size:
@@ -88,18 +91,52 @@ class TextToImageGenerator:
         if not padding:
             padding = self.default_padding
 
+        if isinstance(font, str):
+            # Load the font file once for the whole batch instead of once per image
+            font = ImageFont.truetype(font, size=self.get_font_size(canvas_size, padding))
+
         generated_images = []
+        pending = {}
         for line in lines:
             img_path = output_directory / f"{line}.png"
-            if img_path.exists() and not clobber:
+            if img_path in pending:
+                if clobber:
+                    generated_images.append(img_path)  # same text, already being rendered
+                else:
+                    logger.warning(f"File {img_path} already exists. Skipping...")
+                continue
+            if not clobber and img_path.exists():
                 logger.warning(f"File {img_path} already exists. Skipping...")
                 continue
-            img = self.generate_png(line, canvas_size, padding, background_color, text_color, font)
-            img.save(img_path)
+            pending[img_path] = line
             generated_images.append(img_path)
 
+        # Rendering and PNG encoding run in Pillow's C code with the GIL released, so the
+        # images are produced in parallel on the default thread pool
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(
+                None, self._render_one, img_path, line, canvas_size, padding, background_color, text_color, font
+            )
+            for img_path, line in pending.items()
+        ))
+
         return generated_images
 
+    def _render_one(
+        self,
+        img_path: Path,
+        text: str,
+        canvas_size: Tuple[int, int],
+        padding: float,
+        background_color: str,
+        text_color: str,
+        font: ImageFont.ImageFont,
+    ) -> None:
+        """Render one line of text and save it to `img_path`; zlib level 1 keeps encoding cheap for these flat images."""
+        img = self.generate_png(text, canvas_size, padding, background_color, text_color, font)
+        img.save(img_path, "PNG", compress_level=1)
+
     def generate_png(
         self,
         text: str,
@@ -125,7 +162,8 @@ class TextToImageGenerator:
         """
         img = Image.new("RGB", canvas_size, background_color)
         draw = ImageDraw.Draw(img)
-        font = ImageFont.truetype(font, size=self.get_font_size(canvas_size, padding))
+        if isinstance(font, str):
+            font = ImageFont.truetype(font, size=self.get_font_size(canvas_size, padding))
 
         text_position = self.center_text_position(draw, text, font, canvas_size)
         draw.text(text_position, text, fill=text_color, font=font)
@@ -147,8 +185,10 @@ class TextToImageGenerator:
         Returns:
             Tuple[int, int]: Coordinates for centering the text.
         """
-        text_width, text_height = draw.textsize(text, font=font)
-        return (canvas_size[0] - text_width) // 2, (canvas_size[1] - text_height) // 2
+        # ImageDraw.textsize was removed in Pillow 10; textbbox also reports the glyph offsets,
+        # which are subtracted so the ink itself is centered
+        left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+        return (canvas_size[0] - (right - left)) // 2 - left, (canvas_size[1] - (bottom - top)) // 2 - top
 
     def overlay_images(
         self,
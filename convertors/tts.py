@@ -5,10 +5,11 @@
 
 import header
 from pathlib import Path
+import subprocess
 import tempfile
 import asyncio
+import requests
 import speech_recognition as sr  # Библиотека для распознавания речи
-from pydub import AudioSegment  # Library for audio conversion
 from gtts import gTTS  # Библиотека для текстового воспроизведения
 
 from src.utils.jjson import j_loads, j_loads_ns, j_dumps
@@ -33,34 +34,33 @@ def speech_recognizer(audio_url: str = None, audio_file_path: Path = None, langu
             recognized_text = speech_recognizer(audio_url='https://example.com/audio.ogg')
             print(recognized_text)  # Output: "Привет"
     """
+    # ffmpeg decodes straight to 16 kHz mono 16-bit PCM on stdout, which is handed to the recognizer
+    # as is: no temporary files and no WAV re-encode/re-decode (a WAV written to a pipe has no valid size header)
+    command = ['ffmpeg', '-loglevel', 'error', '-i', 'pipe:0' if audio_url else str(audio_file_path),
+               '-f', 's16le', '-acodec', 'pcm_s16le', '-ac', '1', '-ar', '16000', 'pipe:1']
+    audio_input = None
     if audio_url:
         # Download the audio file
         response = requests.get(audio_url)
-        audio_file_path = Path(tempfile.gettempdir()) / "recognized_audio.ogg"
+        response.raise_for_status()
+        audio_input = response.content
 
-        with open(audio_file_path, 'wb') as f:
-            f.write(response.content)
-
-    # Convert OGG to WAV
-    wav_file_path = audio_file_path.with_suffix('.wav')
-    audio = AudioSegment.from_ogg(audio_file_path)  # Load the OGG file
-    audio.export(wav_file_path, format='wav')  # Export as WAV
+    pcm_data = subprocess.run(command, input=audio_input, capture_output=True, check=True).stdout
 
     # Initialize the recognizer
     recognizer = sr.Recognizer()
-    with sr.AudioFile(str(wav_file_path)) as source:
-        audio_data = recognizer.record(source)
-        try:
-            # Recognize speech using Google Speech Recognition
-            text = recognizer.recognize_google(audio_data, language=language)
-            logger.info(f'Recognized text: {text}')
-            return text
-        except sr.UnknownValueError:
-            logger.error("Google Speech Recognition could not understand audio")
-            return "Sorry, I could not understand the audio."
-        except sr.RequestError as e:
-            logger.error(f"Could not request results from Google Speech Recognition service; {e}")
-            return "Could not request results from the speech recognition service."
+    audio_data = sr.AudioData(pcm_data, 16000, 2)
+    try:
+        # Recognize speech using Google Speech Recognition
+        text = recognizer.recognize_google(audio_data, language=language)
+        logger.info(f'Recognized text: {text}')
+        return text
+    except sr.UnknownValueError:
+        logger.error("Google Speech Recognition could not understand audio")
+        return "Sorry, I could not understand the audio."
+    except sr.RequestError as e:
+        logger.error(f"Could not request results from Google Speech Recognition service; {e}")
+        return "Could not request results from the speech recognition service."
 
 async def text2speech(text: str, lang: str = 'ru') -> str:
     """! Convert text to speech and save it as an audio file.
@@ -4,12 +4,32 @@
 """
 
 """
+import os
+from functools import lru_cache
 from pathlib import Path
 
 from src.utils.xls import read_xls_as_dict, save_xls_file
 
 
-def xls2dict(xls_file: str | Path) -> dict | None:
-    """!"""
+@lru_cache(maxsize=64)
+def _xls2dict_cached(xls_file: str, mtime_ns: int, size: int) -> dict | None:
+    """Read a workbook. `mtime_ns` and `size` only take part in the cache key, so edited files are re-read."""
     return read_xls_as_dict(xls_file = xls_file)
 
+
+def xls2dict(xls_file: str | Path, cached: bool = False) -> dict | None:
+    """! Convert all sheets of an Excel file to a dictionary.
+
+    Args:
+        xls_file (str | Path): Path to the Excel file.
+        cached (bool, optional): If True, results are served from an LRU cache keyed on path, mtime and size.
+            The cached dictionaries are shared between callers and must not be modified. Defaults to False.
+    """
+    if cached:
+        try:
+            stat = os.stat(xls_file)
+        except OSError:
+            pass  # the uncached call below reports the failure
+        else:
+            return _xls2dict_cached(os.path.abspath(xls_file), stat.st_mtime_ns, stat.st_size)
+    return read_xls_as_dict(xls_file = xls_file)
@@ -10,10 +10,12 @@ This module provides utilities for:
 
 Functions:
     - save_csv_file: Save a list of dictionaries to a CSV file.
+    - save_csv_file_async: Save a list of dictionaries to a CSV file on a background thread.
     - read_csv_file: Read CSV content as a list of dictionaries.
     - json_to_csv: Convert JSON data to CSV.
     - csv_to_json: Convert CSV to JSON and save to a file.
     - read_csv_as_dict: Convert CSV content to a dictionary format.
+    - read_csv_lazy: Scan one or more CSV files lazily with Polars.
 
 Example usage:
     >>> data = [{'role': 'user', 'content': 'Hello'}]
@@ -26,14 +28,195 @@ Example usage:
 """
 
 import csv
+import io
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from types import SimpleNamespace
-from typing import List, Dict, Union
-import pandas as pd
-from src.utils.jjson import j_loads, j_loads_ns, j_dumps
+from typing import Callable, Iterator, List, Dict, Union
+
+# pyarrow (~80 ms) and polars (~130 ms) are imported on first use, not with the module
+pa = pa_csv = None
+
+try:
+    import cisv
+except ImportError:
+    cisv = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from src.logger import logger
 
+# Files from this size on are parsed by pyarrow's multithreaded reader; below it the setup cost outweighs the gain
+_ARROW_THRESHOLD = 1024 * 1024
+# cisv splits files from this size on across threads
+_CISV_PARALLEL_THRESHOLD = 32 * 1024 * 1024
+# Buffer for CSV/JSON file objects: one read/write syscall per MiB instead of per 8 KiB
+_BUFFER_SIZE = 1 << 20
+
+
+@lru_cache(maxsize=None)
+def _pyarrow_available() -> bool:
+    """! Import pyarrow into the module globals on first call and tell whether it is installed."""
+    global pa, pa_csv
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return False
+    return True
+
+
+def _iter_csv_dicts(f) -> Iterator[Dict[str, str]]:
+    """! Yield the rows of an open CSV file as dictionaries, exactly as `csv.DictReader` does.
+
+    Rows as wide as the header are built with a single `dict(zip())`; DictReader pays for several
+    Python-level checks per row. Blank lines are skipped, short rows are padded with None and the
+    surplus fields of long rows are collected under the None key, as DictReader does.
+    """
+    return _rows_as_dicts(csv.reader(f))
+
+
+def _rows_as_dicts(rows: Iterator[List[str]]) -> Iterator[Dict[str, str]]:
+    """! Turn parsed CSV rows into dictionaries keyed by the first row, with `csv.DictReader`'s handling of
+    blank, short and long rows (see `_iter_csv_dicts`)."""
+    reader = iter(rows)
+    header = next(reader, None)
+    if header is None:
+        return
+    header = tuple(header)
+    width = len(header)
+    if not width:
+        # A blank first line is an empty header: every field of every non-blank row is surplus
+        yield from ({None: row} for row in reader if row)
+        return
+    for row in reader:
+        if len(row) == width:
+            yield dict(zip(header, row))
+        elif row:
+            record = dict(zip(header, row))
+            if len(row) > width:
+                record[None] = row[width:]
+            else:
+                for key in header[len(row):]:
+                    record[key] = None
+            yield record
+
+
+def _arrow_csv_options(file_path: Path) -> dict | None:
+    """! pyarrow CSV options that read every column as a string, or None if pyarrow cannot map the file like DictReader.
+
+    Empty fields stay empty strings. Duplicate and BOM-prefixed headers are left to DictReader.
+    """
+    with file_path.open('r', newline='', encoding='utf-8') as f:
+        header = next(csv.reader(f), None)
+    if not header or len(set(header)) != len(header) or header[0].startswith('\ufeff'):
+        return None
+    return {
+        'parse_options': pa_csv.ParseOptions(newlines_in_values=True),
+        'convert_options': pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in header},
+            strings_can_be_null=False,
+            quoted_strings_can_be_null=False,
+        ),
+    }
+
+
+def _read_csv_rows_arrow(file_path: Path) -> List[Dict[str, str]] | None:
+    """! Parse a CSV file with pyarrow into DictReader-compatible rows, or return None if pyarrow cannot map it the same way."""
+    options = _arrow_csv_options(file_path)
+    if options is None:
+        return None
+    try:
+        table = pa_csv.read_csv(file_path, **options)
+    except pa.ArrowInvalid:
+        return None  # e.g. a row with a different number of fields - DictReader pads or collects them
+    return table.to_pylist()
+
+
+def _write_json_rows_arrow(csv_file_path: Path, json_file_path: Path) -> bool:
+    """! Stream a CSV file into a JSON array batch by batch with pyarrow and orjson.
+
+    Only one record batch is held in memory at a time. The layout matches `json.dump(rows, f, indent=4)`,
+    except that non-ASCII text is written as UTF-8 instead of `\\u` escapes. Returns False, leaving the
+    output to be rewritten, if pyarrow cannot map the file like DictReader.
+    """
+    options = _arrow_csv_options(csv_file_path)
+    if options is None:
+        return False
+    try:
+        with pa_csv.open_csv(csv_file_path, **options) as reader, \
+                json_file_path.open('wb', buffering=_BUFFER_SIZE) as f:
+            separator = b'[\n    '
+            for batch in reader:
+                for row in batch.to_pylist():
+                    f.write(separator)
+                    # orjson indents by two spaces; string values hold no raw newlines, so re-indenting is a replace
+                    f.write(orjson.dumps(row, option=orjson.OPT_INDENT_2)
+                            .replace(b'\n  ', b'\n        ').replace(b'\n}', b'\n    }'))
+                    separator = b',\n    '
+            f.write(b'[]' if separator == b'[\n    ' else b'\n]')
+    except pa.ArrowInvalid:
+        return False
+    return True
+
+
+def _read_csv_rows_cisv(file_path: Path) -> List[Dict[str, str]]:
+    """! Parse a CSV file with cisv's SIMD tokenizer; files above 32 MiB are split across threads.
+
+    The rows become dictionaries as in the stdlib path: empty rows are skipped, short rows are padded with None
+    and the surplus fields of long rows are kept under the None key.
+    """
+    parallel = file_path.stat().st_size > _CISV_PARALLEL_THRESHOLD
+    return list(_rows_as_dicts(cisv.parse_file(str(file_path), parallel=parallel)))
+
+
+def _read_csv_rows(file_path: Path, engine: str = 'auto') -> List[Dict[str, str]]:
+    """! Read CSV rows as dictionaries of strings, as `csv.DictReader` returns them.
+
+    With `engine='auto'` files of `_ARROW_THRESHOLD` bytes and more are parsed by pyarrow when it is
+    installed and everything else by the stdlib csv reader. 'stdlib', 'pyarrow' and 'cisv' select a parser explicitly.
+    """
+    if engine == 'cisv':
+        if cisv is None:
+            raise ImportError("engine='cisv' requires the cisv package")
+        return _read_csv_rows_cisv(file_path)
+    if engine == 'pyarrow' and not _pyarrow_available():
+        raise ImportError("engine='pyarrow' requires the pyarrow package")
+    if engine not in ('auto', 'stdlib', 'pyarrow'):
+        raise ValueError(f"Unknown CSV engine: {engine!r}")
+
+    if engine == 'pyarrow' or (engine == 'auto' and file_path.stat().st_size >= _ARROW_THRESHOLD and _pyarrow_available()):
+        rows = _read_csv_rows_arrow(file_path)
+        if rows is not None:
+            return rows
+    with file_path.open('r', newline='', encoding='utf-8', buffering=_BUFFER_SIZE) as f:
+        return list(_iter_csv_dicts(f))
+
+def _open_for_write(file_path: Union[str, Path], mode: str):
+    """! Open a CSV file for writing; the parent directories are created only if the first open() finds them missing.
+
+    The path goes to open() as given, without a Path() wrapper and without a mkdir() stat chain on every call.
+    """
+    try:
+        return open(file_path, mode, newline='', encoding='utf-8', buffering=_BUFFER_SIZE)
+    except FileNotFoundError:
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        return open(file_path, mode, newline='', encoding='utf-8', buffering=_BUFFER_SIZE)
+
+@lru_cache(maxsize=64)
+def _row_getter(fieldnames: tuple) -> Callable[[dict], tuple]:
+    """! Row-tuple getter for `save_csv_file`, built once per column layout; repeated appends reuse it."""
+    get = itemgetter(*fieldnames)
+    if len(fieldnames) == 1:
+        return lambda row: (get(row),)  # a single-key itemgetter returns the bare value
+    return get
+
 def save_csv_file(
     data: List[Dict[str, str] | SimpleNamespace],
     file_path: Union[str, Path],
@@ -49,33 +232,110 @@ def save_csv_file(
         exc_info (bool, optional): Include traceback information in logs. Default is True.
 
     Returns:
-        bool: True if successful, otherwise False.
+        bool: True if successful (also for empty `data`, which leaves the file untouched), otherwise False.
 
     Example:
         >>> data = [{'name': 'Alice', 'age': '30'}]
         >>> save_csv_file(data, 'people.csv', mode='w')
         True
     """
+    if not data:
+        return True  # nothing to write: no directory, no file, no header
+
+    try:
+        fieldnames = list(data[0].keys())
+        with _open_for_write(file_path, mode) as f:
+            # The position right after opening tells whether the file is empty: no extra stat, and the
+            # old exists() check ran after open() had already created the file, so new files got no header
+            if f.tell() == 0:
+                csv.writer(f).writerow(fieldnames)
+            _write_csv_rows(f, data, fieldnames)
+        return True
+    except Exception as ex:
+        logger.error(f"Failed to save CSV to {file_path}", exc_info=exc_info)
+        return False
+
+def save_csv_file_async(
+    data: List[Dict[str, str]],
+    file_path: Union[str, Path],
+    mode: str = 'a',
+    exc_info: bool = True
+) -> Future:
+    """! Save a list of dictionaries to a CSV file in the background, like `save_csv_file`.
+
+    The rows are serialized in the calling thread, so `data` may be changed as soon as the call returns;
+    only the file write runs on a single background thread, which also keeps several appends to one file in order.
+
+    Args:
+        data (List[Dict[str, str]]): Data to be saved in CSV format.
+        file_path (str | Path): Path to the CSV file.
+        mode (str, optional): File mode ('a' to append, 'w' to overwrite). Default is 'a'.
+        exc_info (bool, optional): Include traceback information in logs. Default is True.
+
+    Returns:
+        Future: Resolves to True if the file was written, otherwise False. Use `asyncio.wrap_future` to await it.
+
+    Example:
+        >>> future = save_csv_file_async([{'name': 'Alice', 'age': '30'}], 'people.csv')
+        >>> # ... parse the next chunk meanwhile ...
+        >>> future.result()
+        True
+    """
+    future = Future()
+    if not data:
+        future.set_result(True)
+        return future
     try:
-        file_path = Path(file_path)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with file_path.open(mode, newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=data[0].keys())
-            if mode == 'w' or not file_path.exists():
-                writer.writeheader()
-            writer.writerows(data)
+        fieldnames = list(data[0].keys())
+        buffer = io.StringIO()
+        _write_csv_rows(buffer, data, fieldnames)
+    except Exception as ex:
+        logger.error(f"Failed to save CSV to {file_path}", exc_info=exc_info)
+        future.set_result(False)
+        return future
+    return _csv_writer_executor().submit(_write_csv_text, file_path, mode, fieldnames, buffer.getvalue(), exc_info)
+
+def _write_csv_rows(f, data: List[Dict[str, str]], fieldnames: List[str]) -> None:
+    """! Write the rows of `data`, without the header, to an open text file."""
+    if all(len(row) == len(fieldnames) for row in data):
+        # Same keys in every row (itemgetter raises KeyError otherwise): cells are picked
+        # by one C-level itemgetter call per row instead of DictWriter's per-cell lookups
+        get = _row_getter(tuple(fieldnames))
+        try:
+            rows = [get(row) for row in data]
+        except KeyError:
+            rows = None
+        if rows is not None:
+            csv.writer(f).writerows(rows)
+            return
+    # Rows with missing or extra keys keep DictWriter's handling (empty cells / ValueError)
+    csv.DictWriter(f, fieldnames=fieldnames).writerows(data)
+
+@lru_cache(maxsize=1)
+def _csv_writer_executor() -> ThreadPoolExecutor:
+    """! The single background thread behind `save_csv_file_async`, started on first use."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix='csv-writer')
+
+def _write_csv_text(file_path: Union[str, Path], mode: str, fieldnames: List[str], text: str, exc_info: bool) -> bool:
+    """! Write rows serialized by `save_csv_file_async`, with the header when the file is empty."""
+    try:
+        with _open_for_write(file_path, mode) as f:
+            if f.tell() == 0:
+                csv.writer(f).writerow(fieldnames)
+            f.write(text)
         return True
     except Exception as ex:
         logger.error(f"Failed to save CSV to {file_path}", exc_info=exc_info)
         return False
 
-def read_csv_file(file_path: Union[str, Path], exc_info: bool = True) -> List[Dict[str, str]] | None:
+def read_csv_file(file_path: Union[str, Path], exc_info: bool = True, engine: str = 'auto') -> List[Dict[str, str]] | None:
     """! Read CSV content as a list of dictionaries.
 
     Args:
         file_path (str | Path): Path to the CSV file.
         exc_info (bool, optional): Include traceback information in logs. Default is True.
+        engine (str, optional): Parser: 'auto' (pyarrow for files from 1 MiB when installed, else the stdlib),
+            'stdlib', 'pyarrow' or 'cisv' (optional SIMD parser). Default is 'auto'.
 
     Returns:
         List[Dict[str, str]] | None: List of dictionaries with CSV data or None if failed.
@@ -86,8 +346,7 @@ def read_csv_file(file_path: Union[str, Path], exc_info: bool = True) -> List[Di
         [{'name': 'Alice', 'age': '30'}]
     """
     try:
-        with Path(file_path).open('r', encoding='utf-8') as f:
-            return list(csv.DictReader(f))
+        return _read_csv_rows(Path(file_path), engine)
     except Exception as ex:
         logger.error(f"Failed to read CSV from {file_path}", exc_info=exc_info)
         return
@@ -109,11 +368,21 @@ def read_csv_as_json(csv_file_path: Union[str, Path], json_file_path: Union[str,
         True
     """
     try:
-        data = read_csv_file(csv_file_path, exc_info=exc_info)
-        if data is None:
-            return False
-        with Path(json_file_path).open('w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
+        csv_file_path, json_file_path = Path(csv_file_path), Path(json_file_path)
+        if orjson and csv_file_path.stat().st_size >= _ARROW_THRESHOLD and _pyarrow_available() \
+                and _write_json_rows_arrow(csv_file_path, json_file_path):
+            return True
+        # Rows are encoded one at a time as they are read, so the file is never held in memory as a list.
+        # The output is byte-for-byte what json.dump(rows, f, indent=4) writes.
+        encode = json.JSONEncoder(indent=4).encode
+        with csv_file_path.open('r', newline='', encoding='utf-8', buffering=_BUFFER_SIZE) as csv_f, \
+                json_file_path.open('w', encoding='utf-8', buffering=_BUFFER_SIZE) as f:
+            separator = '[\n    '
+            for row in _iter_csv_dicts(csv_f):
+                f.write(separator)
+                f.write(encode(row).replace('\n', '\n    '))
+                separator = ',\n    '
+            f.write('[]' if separator == '[\n    ' else '\n]')
         return True
     except Exception as ex:
         logger.error(f"Failed to convert CSV to JSON at {json_file_path}", exc_info=exc_info)
@@ -134,31 +403,68 @@ def read_csv_as_dict(csv_file: Union[str, Path]) -> dict | None:
         {'data': [{'name': 'Alice', 'age': '30'}]}
     """
     try:
-        with Path(csv_file).open('r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            return {"data": [row for row in reader]}
+        return {"data": _read_csv_rows(Path(csv_file))}
     except Exception as ex:
         logger.error("Failed to read CSV as dictionary", exc_info=True)
         return
 
-def read_csv_as_ns(file_path: Union[str, Path]) -> List[dict]:
-    """! Load CSV data into a list of dictionaries using Pandas.
+def read_csv_as_ns(file_path: Union[str, Path]) -> List[SimpleNamespace]:
+    """! Load CSV data into a list of SimpleNamespace objects, one per row.
 
     Args:
         file_path (str | Path): Path to the CSV file.
 
     Returns:
-        List[dict]: List of dictionaries representing the CSV content.
+        List[SimpleNamespace]: One namespace per CSV row, with the column names as attributes.
 
     Example:
         >>> data = read_csv_as_ns('people.csv')
         >>> print(data)
-        [{'name': 'Alice', 'age': '30'}]
+        [namespace(name='Alice', age='30')]
     """
     try:
-        df = pd.read_csv(file_path)
-        data: SimpleNamespace = SimpleNamespace(**df.to_dict(orient='records'))
-        return data
+        # Same parser as read_csv_file (pyarrow for large files), values stay strings
+        return [SimpleNamespace(**row) for row in _read_csv_rows(Path(file_path))]
     except Exception as ex:
         logger.error(f"Failed to load CSV as namespaces from {file_path}", exc_info=True)
         return []
+
+def read_csv_lazy(
+    file_path: Union[str, Path, List[Union[str, Path]]],
+    columns: List[str] | None = None,
+    filter_expr=None,
+) -> "pl.LazyFrame | None":
+    """! Scan CSV data lazily with Polars, without reading it yet.
+
+    Nothing is parsed until the caller collects the frame. The selected columns and the filter are pushed
+    down into Polars' multithreaded reader, so unused columns and rows are skipped while reading.
+
+    Args:
+        file_path (str | Path | List[str | Path]): CSV file, glob pattern, or list of files read as one frame.
+        columns (List[str], optional): Columns to keep. Default is all columns.
+        filter_expr (pl.Expr, optional): Row filter, e.g. `pl.col('age') > 30`. Default is no filter.
+
+    Returns:
+        pl.LazyFrame | None: The lazy frame, or None if Polars is not installed or the scan could not be set up.
+
+    Example:
+        >>> frame = read_csv_lazy('people.csv', columns=['name'], filter_expr=pl.col('age') > 30)
+        >>> frame.collect().to_dicts()
+        [{'name': 'Alice'}]
+    """
+    try:
+        import polars as pl
+    except ImportError:
+        logger.error("read_csv_lazy requires the polars package")
+        return
+    try:
+        sources = [str(path) for path in file_path] if isinstance(file_path, (list, tuple)) else str(file_path)
+        frame = pl.scan_csv(sources)
+        if filter_expr is not None:
+            frame = frame.filter(filter_expr)
+        if columns:
+            frame = frame.select(columns)
+        return frame
+    except Exception as ex:
+        logger.error(f"Failed to scan CSV from {file_path}", exc_info=True)
+        return
@@ -5,5 +5,12 @@
 
 import sys,os
 from pathlib import Path
-__root__ : Path = os.getcwd() [:os.getcwd().rfind(r'hypotez')+7]
-sys.path.append (__root__)  
\ No newline at end of file
+# A root resolved by an earlier import (also in a parent process) is reused from the environment
+__root__ : Path = os.environ.get('PROJECT_ROOT')
+if not __root__ or not os.path.isdir(__root__):
+    _cwd = os.getcwd()
+    _idx = _cwd.rfind(r'hypotez')
+    __root__ = _cwd[:_idx + 7] if _idx >= 0 else _cwd
+    os.environ['PROJECT_ROOT'] = __root__
+if __root__ not in sys.path:
+    sys.path.append(__root__)
@@ -8,13 +8,22 @@ Module for file operations.
 
 """
 
+import io
 import os
+import asyncio
 import json
+import mmap
+import re
 import fnmatch
-from typing import List, Optional, Union
+from functools import lru_cache
+from typing import Callable, Iterator, List, Optional, Union
 from pathlib import Path
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from src.logger import logger
 
+# Buffer for text file objects: one read/write syscall per MiB instead of per 8 KiB
+_BUFFER_SIZE = 1 << 20
+
 
 def save_text_file(
     data: str | list | dict,
@@ -48,13 +57,20 @@ def save_text_file(
     More documentation: https://github.com/hypo69/tiny-utils/wiki/Files-and-Directories#save_text_file
     """
     try:
-        file_path = Path(file_path)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        with file_path.open(mode, encoding="utf-8") as file:  # Ensure UTF-8 encoding
+        # The path goes to open() as given; the directories are created only when the first open() finds them missing
+        try:
+            file = open(file_path, mode, encoding="utf-8", buffering=_BUFFER_SIZE)  # Ensure UTF-8 encoding
+        except FileNotFoundError:
+            Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+            file = open(file_path, mode, encoding="utf-8", buffering=_BUFFER_SIZE)
+        with file:
             if isinstance(data, list):
-                for line in data:
-                    file.write(f"{line}\n")
-                    #logger.debug(f"{file_path=}", None, False)
+                # One joined string and one write instead of a formatted write per line
+                if data:
+                    file.write("\n".join(map(str, data)))
+                    file.write("\n")
+            elif isinstance(data, dict):
+                json.dump(data, file, ensure_ascii=False)
             else:
                 file.write(data)
         return True
@@ -63,6 +79,34 @@ def save_text_file(
         return False
 
 
+async def save_text_file_async(
+    data: str | list | dict,
+    file_path: str | Path,
+    mode: str = "w",
+    exc_info: bool = True,
+) -> bool:
+    """
+    Saves the provided data to a file like `save_text_file`, without blocking the event loop.
+
+    The write runs on the default thread pool, so many files saved with `asyncio.gather` are written concurrently.
+
+    Args:
+        data (str | list | dict): The data to be written to the file. It can be a string, list, or dictionary.
+        file_path (str | Path): The full path to the file where the data should be saved.
+        mode (str, optional): The file mode for writing, defaults to 'w'.
+        exc_info (bool, optional): If True, logs traceback information in case of an error. Defaults to True.
+
+    Returns:
+        bool: Returns True if the file is successfully saved, otherwise returns False.
+
+    Example:
+        >>> results = await asyncio.gather(*(save_text_file_async(text, f"out/{i}.txt") for i, text in enumerate(texts)))
+        >>> print(all(results))
+        True
+    """
+    return await asyncio.to_thread(save_text_file, data, file_path, mode, exc_info)
+
+
 def read_text_file(
     file_path: str | Path, as_list: bool = False, extensions: list[str] = None, exc_info: bool = True
 ) -> list[str] | str | None:
@@ -80,49 +124,122 @@ def read_text_file(
     """
     path = Path(file_path)
 
-    if path.is_file():
-        try:
-            with path.open("r", encoding="utf-8") as f:
-                return [line.strip() for line in f][0]
-        except Exception as ex:
-            if exc_info:
-                logger.error(f"Failed to read file {file_path}.", exc_info=exc_info)
-            return
-    elif path.is_dir():
-        try:
-            content = []
-            for file in path.iterdir():
-                if file.is_file() and (not extensions or file.suffix in extensions):
-                    with file.open("r", encoding="utf-8") as f:
-                        if as_list:
-                            content.extend(line.strip() for line in f)
-                        else:
-                            content.append(f.read())
-            
-            return content if as_list else "\n".join(content)
-        except Exception as ex:
-            if exc_info:
-                logger.error(f"Failed to read files in directory {file_path}.", exc_info=exc_info)
-            return
-    else:
+    # No is_file()/is_dir() probing up front: open() fails anyway if the path is not a readable file
+    try:
+        text = _read_text(path)
+    except FileNotFoundError:
         logger.warning(f"File or directory '{file_path}' does not exist.")
         return
+    except OSError as ex:
+        if path.is_dir():
+            return _read_text_dir(path, as_list, extensions, exc_info)
+        if exc_info:
+            logger.error(f"Failed to read file {file_path}.", exc_info=exc_info)
+        return
+    except Exception as ex:
+        if exc_info:
+            logger.error(f"Failed to read file {file_path}.", exc_info=exc_info)
+        return
+    return [line.strip() for line in io.StringIO(text)] if as_list else text
+
+
+# Files from this size on are memory-mapped and decoded in place instead of being read into a bytes copy first
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _read_text(path: str | Path) -> str:
+    """Read a whole UTF-8 text file with universal newlines, like text-mode `open()`, in one read or one mmap."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            text = f.read().decode("utf-8")
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                text = str(mapped, "utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _read_text_dir(path: Path, as_list: bool, extensions: list[str] | None, exc_info: bool) -> list[str] | str | None:
+    """Read all files in a directory, optionally filtered by extension, for `read_text_file`."""
+    try:
+        content = []
+        # DirEntry.is_file() uses the type from the directory listing, so no stat per entry
+        with os.scandir(path) as entries:
+            files = [
+                entry.path for entry in entries
+                if (not extensions or os.path.splitext(entry.name)[1] in extensions) and entry.is_file()
+            ]
+        for file in files:
+            text = _read_text(file)
+            if as_list:
+                content.extend(line.strip() for line in io.StringIO(text))
+            else:
+                content.append(text)
+
+        return content if as_list else "\n".join(content)
+    except Exception as ex:
+        if exc_info:
+            logger.error(f"Failed to read files in directory {path}.", exc_info=exc_info)
+        return
+
+
+
+def _list_filenames(directory: str | Path, extensions: frozenset[str]) -> list[str]:
+    """Lists the regular files in `directory` whose lowercased extension is in `extensions` (all files if it is empty)."""
+    # os.scandir reports the entry type from the directory listing itself, so regular files cost no extra stat
+    with os.scandir(directory) as entries:
+        if not extensions:
+            return [entry.name for entry in entries if entry.is_file()]
+        return [
+            entry.name for entry in entries
+            if os.path.splitext(entry.name)[1].lower() in extensions and entry.is_file()
+        ]
+
+
+def _list_directory_names(directory: str | Path) -> list[str]:
+    """Lists the subdirectories of `directory`."""
+    with os.scandir(directory) as entries:
+        return [entry.name for entry in entries if entry.is_dir()]
 
 
+# A directory's mtime changes whenever an entry is added, removed or renamed, so it is part of the key
+@lru_cache(maxsize=1024)
+def _filenames_cached(directory: str, mtime_ns: int, extensions: frozenset[str]) -> tuple[str, ...]:
+    return tuple(_list_filenames(directory, extensions))
+
+
+@lru_cache(maxsize=1024)
+def _directory_names_cached(directory: str, mtime_ns: int) -> tuple[str, ...]:
+    return tuple(_list_directory_names(directory))
+
+
+def clear_listing_cache() -> None:
+    """
+    Clears the directory listings cached by `get_filenames` and `get_directory_names` with `cached=True`.
+
+    Needed only when a directory may change without its mtime changing, e.g. on filesystems with coarse timestamps.
+    """
+    _filenames_cached.cache_clear()
+    _directory_names_cached.cache_clear()
+
 
 def get_filenames(
-    directory: str | Path, extensions: str | List[str] = "*", exc_info: bool = True
+    directory: str | Path, extensions: str | List[str] = "*", exc_info: bool = True, cached: bool = False
 ) -> list[str]:
     """
     Retrieves all filenames from the specified directory, optionally filtered by file extensions.
 
     Args:
         directory (str | Path): Path to the directory from which filenames should be retrieved.
-        extensions (str | List[str], optional): File extension(s) to filter the filenames. It can be a single extension (e.g., '*.txt') or a list of extensions (e.g., ['*.txt', '*.py']). If '*' is specified, all files are returned. Defaults to '*'..
+        extensions (str | List[str], optional): File extension(s) to filter the filenames, matched case-insensitively. It can be a single extension (e.g., '*.txt') or a list of extensions (e.g., ['*.txt', '*.py']). If '*' is specified, all files are returned. Defaults to '*'..
         exc_info (bool, optional): If True, logs traceback information in case of an error. Defaults to True.
+        cached (bool, optional): If True, the listing is served from an LRU cache keyed on the directory and its mtime,
+            so repeated calls cost one stat until the directory changes. Defaults to False.
 
     Returns:
         list[str]: List of filenames found in the directory, optionally filtered by the provided extensions.
+            In directory order, not sorted; use `sorted()` when a stable order is needed.
 
     Example:
         >>> files: list[str] = get_filenames(directory=".", extensions="*.py")
@@ -132,21 +249,20 @@ def get_filenames(
     More documentation: https://github.com/hypo69/tiny-utils/wiki/Files-and-Directories#get_filenames
     """
     try:
-        path = Path(directory)
         if isinstance(extensions, str):
             if extensions == "*":
                 extensions = []  # If '*' is specified, no filtering by extension
             else:
                 extensions = [extensions]  # Convert a single extension to a list
 
-        # Normalize extensions to include a leading dot if necessary
-        extensions = [ext if ext.startswith(".") else f".{ext}" for ext in extensions]
+        # Normalize extensions once to a lowercase set with a leading dot: '*.py', 'py', '.PY' all mean '.py';
+        # each entry then costs one hash lookup, and 'IMG.JPG' matches '*.jpg'
+        extensions = frozenset("." + ext.lstrip("*").lstrip(".").lower() for ext in extensions)
 
-        filenames = []
-        for file in path.iterdir():
-            if file.is_file() and (not extensions or file.suffix in extensions):
-                filenames.append(file.name)
-        return filenames
+        if cached:
+            directory = os.path.abspath(directory)
+            return list(_filenames_cached(directory, os.stat(directory).st_mtime_ns, extensions))
+        return _list_filenames(directory, extensions)
     except Exception as ex:
         if exc_info:
             logger.warning(
@@ -157,16 +273,18 @@ def get_filenames(
         return []
 
 
-def get_directory_names(directory: str | Path, exc_info: bool = True) -> list[str]:
+def get_directory_names(directory: str | Path, exc_info: bool = True, cached: bool = False) -> list[str]:
     """
     Retrieves all directory names from the specified directory.
 
     Args:
         directory (str | Path): Path to the directory from which directory names should be retrieved.
         exc_info (bool, optional): If True, logs traceback information in case of an error. Defaults to True.
+        cached (bool, optional): If True, the listing is served from an LRU cache keyed on the directory and its mtime.
+            Defaults to False.
 
     Returns:
-        list[str]: List of directory names found in the specified directory.
+        list[str]: List of directory names found in the specified directory, in directory order, not sorted.
 
     Example:
         >>> directories: list[str] = get_directory_names(directory=".") 
@@ -176,7 +294,10 @@ def get_directory_names(directory: str | Path, exc_info: bool = True) -> list[st
     More documentation: https://github.com/hypo69/tiny-utils/wiki/Files-and-Directories#get_directory_names
     """
     try:
-        return [entry.name for entry in Path(directory).iterdir() if entry.is_dir()]
+        if cached:
+            directory = os.path.abspath(directory)
+            return list(_directory_names_cached(directory, os.stat(directory).st_mtime_ns))
+        return _list_directory_names(directory)
     except Exception as ex:
         if exc_info:
             logger.warning(
@@ -187,6 +308,69 @@ def get_directory_names(directory: str | Path, exc_info: bool = True) -> list[st
         return 
 
 
+def _scan_dir(directory: str) -> tuple[list[os.DirEntry], list[str]]:
+    """
+    Lists one directory with `os.scandir`: its non-directory entries and the paths of its real subdirectories.
+
+    Entry types come from the directory listing, so only symlinks cost a stat. Symlinks to directories are
+    not returned as subdirectories, and an unreadable directory is empty, as with `os.walk` defaults.
+    """
+    files, subdirs = [], []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    files.append(entry)
+                elif not entry.is_symlink():
+                    subdirs.append(entry.path)
+    except OSError:
+        pass
+    return files, subdirs
+
+
+def _walk_files(root_dir: str | Path, max_workers: int | None = None) -> Iterator[os.DirEntry]:
+    """
+    Yields the non-directory entries below `root_dir`, the same files `os.walk` lists.
+
+    With `max_workers` the directories are scanned on a thread pool, so the metadata latency of slow
+    (network) filesystems overlaps; on local disks the sequential walk is faster.
+    """
+    if not max_workers:
+        stack = [os.fspath(root_dir)]
+        while stack:
+            files, subdirs = _scan_dir(stack.pop())
+            yield from files
+            stack.extend(subdirs)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(_scan_dir, os.fspath(root_dir))}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                pending.update(executor.submit(_scan_dir, subdir) for subdir in subdirs)
+                yield from files
+
+
+def _compile_patterns(patterns: List[str]) -> Callable[[str], object]:
+    """
+    Fuses glob patterns into one compiled regex, so each file name is matched with a single `re.match` call.
+
+    Matching follows `fnmatch.fnmatch`, including its case-insensitivity on Windows.
+    """
+    if not patterns:
+        return lambda name: None
+    match = re.compile("|".join(f"(?:{fnmatch.translate(os.path.normcase(pattern))})" for pattern in patterns)).match
+    if os.path.normcase("A") != "A":
+        return lambda name: match(os.path.normcase(name))
+    return match
+
+
 def recursive_get_filenames(root_dir: str | Path, pattern: str) -> List[str]:
     """
     Recursively searches directories and gathers file paths matching the given pattern.
@@ -196,7 +380,7 @@ def recursive_get_filenames(root_dir: str | Path, pattern: str) -> List[str]:
         pattern (str): The pattern to match files against (e.g., '*.txt').
 
     Returns:
-        List[str]: A list of file paths matching the specified pattern.
+        List[str]: A list of file paths matching the specified pattern, in walk order, not sorted.
 
     Example:
         >>> matched_files: list[str] = recursive_get_filenames(root_dir=".", pattern="*.py")
@@ -205,16 +389,47 @@ def recursive_get_filenames(root_dir: str | Path, pattern: str) -> List[str]:
 
     More documentation: https://github.com/hypo69/tiny-utils/wiki/Files-and-Directories#recursive_get_filenames
     """
-    matches = []
-    for dirpath, _, filenames in os.walk(root_dir):
-        for filename in fnmatch.filter(filenames, pattern):
-            matches.append(os.path.join(dirpath, filename))
-    return matches
+    return list(iter_recursive_filepaths(root_dir, pattern))
+
+
+def iter_recursive_filepaths(
+    root_dir: str | Path,
+    patterns: str | List[str] = '*',
+    max_workers: int | None = None,
+) -> Iterator[str]:
+    """
+    Lazily yields the paths of all files below `root_dir` matching the specified pattern or patterns.
+
+    Paths are produced while the tree is walked, so memory holds one directory listing and the paths of
+    the directories still to visit, not the full result; the order is unspecified.
+
+    Args:
+        root_dir (str | Path): The root directory to start the recursive search.
+        patterns (str | List[str], optional): A pattern or list of patterns to filter files.
+            Defaults to '*', which matches all files.
+        max_workers (int, optional): Number of threads scanning directories in parallel. Defaults to None, a sequential walk.
+
+    Yields:
+        str: The path of each matching file.
+
+    Example:
+        >>> for path in iter_recursive_filepaths('.', ['*.txt', '*.md']):
+        ...     print(path)
+        ./file1.txt
+        ./file2.md
+    """
+    if isinstance(patterns, str):
+        patterns = [patterns]
+    match = _compile_patterns(patterns)
+    for entry in _walk_files(root_dir, max_workers):
+        if match(entry.name):
+            yield entry.path
 
 def recursively_get_filepath(
     root_dir: str | Path, 
     patterns: str | List[str] = '*', 
-    exc_info: bool = True
+    exc_info: bool = True,
+    max_workers: int | None = None,
 ) -> List[str] | None:
     """
     Recursively retrieves all file paths in the directory matching the specified pattern or patterns.
@@ -224,9 +439,11 @@ def recursively_get_filepath(
         patterns (str | List[str], optional): A pattern or list of patterns to filter files. 
             Defaults to '*', which matches all files.
         exc_info (bool, optional): If True, logs traceback information in case of an error.
+        max_workers (int, optional): Number of threads scanning directories in parallel. Worth it on
+            network filesystems; defaults to None, a sequential walk.
 
     Returns:
-        List[str]: A list of file paths matching the specified pattern(s).
+        List[str]: A list of file paths matching the specified pattern(s), in walk order, not sorted.
 
     Example:
         >>> files = recursively_get_filepath('.', ['*.txt', '*.md'])
@@ -234,14 +451,8 @@ def recursively_get_filepath(
         ['./file1.txt', './file2.md']
     """
     try:
-        if isinstance(patterns, str):
-            patterns = [patterns]  # Convert single string pattern to list
-
-        file_paths = []
-        for pattern in patterns:
-            file_paths.extend(Path(root_dir).rglob(pattern))
-
-        return [str(file) for file in file_paths]
+        # One walk for all patterns instead of an rglob() per pattern; a file matching several patterns is listed once
+        return list(iter_recursive_filepaths(root_dir, patterns, max_workers))
     except Exception as ex:
         if exc_info:
             logger.error(
@@ -256,7 +467,8 @@ def recursive_read_text_files(
     root_dir: str | Path, 
     patterns: str | list[str], 
     as_list: bool = False, 
-    exc_info: bool = True
+    exc_info: bool = True,
+    max_workers: int | None = None,
 ) -> list[str]:
     """
     Recursively reads text files from the specified root directory that match the given patterns.
@@ -268,9 +480,12 @@ def recursive_read_text_files(
         as_list (bool, optional): If True, returns the file content as a list of lines.
                                   Defaults to False.
         exc_info (bool, optional): If True, includes exception information in warnings. Defaults to True.
+        max_workers (int, optional): Number of threads scanning directories in parallel. Worth it on
+                                     network filesystems; defaults to None, a sequential walk.
 
     Returns:
-        list[str]: List of file contents (or lines if `as_list=True`) that match the specified patterns.
+        list[str]: List of file contents (or lines if `as_list=True`) that match the specified patterns,
+                   in walk order, not sorted.
 
     Example:
         >>> contents = recursive_read_text_files("/path/to/root", ["*.txt", "*.md"], as_list=True)
@@ -292,21 +507,22 @@ def recursive_read_text_files(
     if isinstance(patterns, str):
         patterns = [patterns]
 
-    for root, dirs, files in os.walk(root_path):
-        for filename in files:
-            # Check if the filename matches any of the specified patterns
-            if any(fnmatch.fnmatch(filename, pattern) for pattern in patterns):
-                file_path = Path(root) / filename
-
-                try:
-                    with file_path.open("r", encoding="utf-8") as file:
-                        if as_list:
-                            # Read lines if `as_list=True`
-                            matches.extend(file.readlines())
-                        else:
-                            # Read entire content otherwise
-                            matches.append(file.read())
-                except Exception as ex:
-                    logger.warning(f"Failed to read file '{file_path}'.", exc_info=exc_info)
+    match = _compile_patterns(patterns)
+    for entry in _walk_files(root_path, max_workers):
+        # Check if the filename matches any of the specified patterns
+        if match(entry.name):
+            file_path = entry.path
+
+            try:
+                # The whole file in one read, decoded at once, instead of buffered line-by-line reads
+                text = _read_text(file_path)
+                if as_list:
+                    # Read lines if `as_list=True`; StringIO splits on "\n" only, exactly as readlines() did
+                    matches.extend(io.StringIO(text).readlines())
+                else:
+                    # Read entire content otherwise
+                    matches.append(text)
+            except Exception as ex:
+                logger.warning(f"Failed to read file '{file_path}'.", exc_info=exc_info)
 
     return matches
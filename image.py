@@ -7,12 +7,18 @@ Image Saving Utilities.
 This module provides asynchronous functions to download, save, and retrieve image data.
 
 Functions:
-    save_png_from_url(image_url: str, filename: str | Path) -> str | None:
+    save_png_from_url(image_url: str, filename: str | Path, session: aiohttp.ClientSession | None = None) -> str | None:
         Download an image from a URL and save it locally asynchronously.
 
+    save_many_png_from_urls(urls_and_names: list[tuple[str, str | Path]], limit: int = 100) -> list[str | None]:
+        Download several images concurrently over one shared session.
+
     save_png(image_data: bytes, file_name: str | Path) -> str | None:
         Save an image in PNG format asynchronously.
 
+    save_png_from_path(src_path: str | Path, file_name: str | Path) -> str | None:
+        Save an image file from disk in PNG format, copying PNG sources in the kernel.
+
     get_image_data(file_name: str | Path) -> bytes | None:
         Retrieve binary data of a file if it exists.
 
@@ -31,6 +37,10 @@ Examples:
 
 import aiohttp
 import aiofiles
+import shutil
+import struct
+import zlib
+from io import BytesIO
 from PIL import Image
 from pathlib import Path
 import asyncio
@@ -39,13 +49,15 @@ from src.utils.printer import pprint
 
 
 async def save_png_from_url(
-    image_url: str, filename: str | Path
+    image_url: str, filename: str | Path, session: aiohttp.ClientSession | None = None
 ) -> str | None:
     """Download an image from a URL and save it locally asynchronously.
 
     Args:
         image_url (str): The URL to download the image from.
         filename (str | Path): The name of the file to save the image to.
+        session (aiohttp.ClientSession, optional): Session to download with, so that many downloads share
+            its connection pool, DNS cache and TLS sessions. Defaults to a new session for this call.
 
     Returns:
         str | None: The path to the saved file or `None` if the operation failed.
@@ -55,10 +67,11 @@ async def save_png_from_url(
         'local_image.png'
     """
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(image_url) as response:
-                response.raise_for_status()
-                image_data = await response.read()
+        if session is None:
+            async with aiohttp.ClientSession() as own_session:
+                image_data = await _download(own_session, image_url)
+        else:
+            image_data = await _download(session, image_url)
     except Exception as ex:
         logger.error("Error downloading image", ex, exc_info=True)
         return 
@@ -66,6 +79,55 @@ async def save_png_from_url(
     return await save_png(image_data, filename)
 
 
+async def _download(session: aiohttp.ClientSession, url: str) -> bytes:
+    """Fetch the body of `url`, raising for HTTP error statuses."""
+    async with session.get(url) as response:
+        response.raise_for_status()
+        return await response.read()
+
+
+async def save_many_png_from_urls(
+    urls_and_names: list[tuple[str, str | Path]], limit: int = 100
+) -> list[str | None]:
+    """Download several images concurrently over one shared session and save them as PNG.
+
+    Args:
+        urls_and_names (list[tuple[str, str | Path]]): Pairs of image URL and file name to save it to.
+        limit (int, optional): Maximum number of simultaneous connections. Defaults to 100.
+
+    Returns:
+        list[str | None]: For each pair, the path to the saved file or `None` if that download or save failed.
+
+    Example:
+        >>> asyncio.run(save_many_png_from_urls([("https://example.com/a.png", "a.png"), ("https://example.com/b.png", "b.png")]))
+        ['a.png', 'b.png']
+    """
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=limit)) as session:
+        return await asyncio.gather(
+            *(save_png_from_url(url, filename, session) for url, filename in urls_and_names)
+        )
+
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _is_png(image_data: bytes) -> bool:
+    """Check the PNG signature and the CRC of the IHDR chunk that must follow it, without decoding the image."""
+    if len(image_data) < 33 or not image_data.startswith(_PNG_SIGNATURE):
+        return False
+    length, chunk_type = struct.unpack_from(">I4s", image_data, 8)
+    (crc,) = struct.unpack_from(">I", image_data, 29)
+    return length == 13 and chunk_type == b"IHDR" and zlib.crc32(image_data[12:29]) == crc
+
+
+def _encode_png(image_data: bytes) -> bytes:
+    """Convert image data in any format Pillow can read to PNG bytes."""
+    with Image.open(BytesIO(image_data)) as image:
+        buffer = BytesIO()
+        image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
 async def save_png(image_data: bytes, file_name: str | Path) -> str | None:
     """Save an image in PNG format asynchronously.
 
@@ -85,21 +147,23 @@ async def save_png(image_data: bytes, file_name: str | Path) -> str | None:
     file_path = Path(file_name)
 
     try:
-        # Create necessary directories
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write file
-        async with aiofiles.open(file_path, "wb") as file:
+        # PNG data with a valid header is written as is; anything else is converted once, in memory and
+        # off the event loop (Pillow rejects broken data there), instead of being written, decoded from disk
+        # and re-encoded over itself
+        if not _is_png(image_data):
+            image_data = await asyncio.to_thread(_encode_png, image_data)
+
+        # Write file; the directories are created only when the first open() finds them missing,
+        # not with a mkdir/stat chain on every call
+        try:
+            file = await aiofiles.open(file_path, "wb")
+        except FileNotFoundError:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file = await aiofiles.open(file_path, "wb")
+        try:
             await file.write(image_data)
-
-        # Verify file creation
-        if not file_path.exists():
-            logger.error(f"File {file_path} was not created.")
-            return
-
-        # Open and save the image
-        image = Image.open(file_path)
-        image.save(file_path, "PNG")
+        finally:
+            await file.close()
 
         # Verify file size
         if file_path.stat().st_size == 0:
@@ -113,6 +177,44 @@ async def save_png(image_data: bytes, file_name: str | Path) -> str | None:
     return str(file_path)
 
 
+async def save_png_from_path(src_path: str | Path, file_name: str | Path) -> str | None:
+    """Save an image file from disk in PNG format asynchronously.
+
+    A source that already is a PNG is copied by the kernel (`os.sendfile` on Linux, `fcopyfile` on macOS via
+    `shutil.copyfile`) without passing through Python buffers; other formats are converted by `save_png`.
+
+    Args:
+        src_path (str | Path): Path to the source image.
+        file_name (str | Path): The name of the file to save the image to.
+
+    Returns:
+        str | None: The path to the saved file or `None` if the operation failed.
+
+    Example:
+        >>> asyncio.run(save_png_from_path("downloads/photo.png", "images/photo.png"))
+        'images/photo.png'
+    """
+    file_path = Path(file_name)
+
+    try:
+        with open(src_path, "rb") as file:
+            header = file.read(33)
+        if not _is_png(header):
+            return await save_png(await asyncio.to_thread(Path(src_path).read_bytes), file_path)
+
+        try:
+            await asyncio.to_thread(shutil.copyfile, src_path, file_path)
+        except FileNotFoundError:
+            # The source was just read, so it is the target directory that is missing
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(shutil.copyfile, src_path, file_path)
+    except Exception as ex:
+        logger.critical(f"Failed to save file {file_path}", ex, exc_info=True)
+        return
+
+    return str(file_path)
+
+
 def get_image_data(file_name: str | Path) -> bytes | None:
     """Retrieve binary data of a file if it exists.
 
@@ -20,24 +20,105 @@ from math import log
 from pathlib import Path
 from typing import List, Dict, Optional, Any
 from types import SimpleNamespace
+import copy
 import json
 import os
 import re
-import pandas as pd
+import csv
+import mmap
 from json_repair import repair_json
 from typing import Any
 from pathlib import Path
 import json
-import pandas as pd
 from types import SimpleNamespace
-from collections import OrderedDict
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from src.logger import logger
 from src.utils.printer import pprint
 from .convertors.dict import dict2ns
 
 
+def _ns_default(obj: Any) -> dict:
+    """Encoder hook that serializes SimpleNamespace objects as their attribute dictionaries."""
+    if isinstance(obj, SimpleNamespace):
+        return vars(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Encoders are built once per `ensure_ascii` value instead of on every `json.dump` call
+_JSON_ENCODERS = {
+    ensure_ascii: json.JSONEncoder(ensure_ascii=ensure_ascii, default=_ns_default)
+    for ensure_ascii in (True, False)
+}
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson else 0
+
+
+def _dump(data: Any, path: Path, mode: str, ensure_ascii: bool, line: bool = False) -> None:
+    """Write data to `path` as JSON, converting SimpleNamespace objects while encoding.
+
+    orjson is used when it can honour `ensure_ascii` and its UTF-8 output is written as is;
+    otherwise the cached stdlib encoder streams the encoded chunks into the file
+    instead of building the whole document first. With `line` the document is
+    terminated by a newline, as a JSON Lines record.
+    """
+    if orjson and not ensure_ascii:
+        option = _ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE if line else _ORJSON_OPTIONS
+        try:
+            payload = orjson.dumps(data, default=_ns_default, option=option)
+        except orjson.JSONEncodeError:
+            payload = None  # e.g. integers wider than 64 bits - let the stdlib handle them
+        if payload is not None:
+            with path.open(mode + "b") as f:
+                f.write(payload)
+            return
+    with path.open(mode, encoding="utf-8") as f:
+        f.writelines(_JSON_ENCODERS[ensure_ascii].iterencode(data))
+        if line:
+            f.write("\n")
+
+
+# orjson parses integers wider than 64 bits as floats, so documents that may hold them go to the stdlib
+_WIDE_INT_RE = re.compile(r'\d{19}')
+_WIDE_INT_BYTES_RE = re.compile(rb'\d{19}')
+
+
+def _loads(data: str | bytes | memoryview) -> Any:
+    """Parse JSON text or UTF-8 bytes, using orjson when available."""
+    wide_int_re = _WIDE_INT_RE if isinstance(data, str) else _WIDE_INT_BYTES_RE
+    if orjson and not wide_int_re.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            ...  # NaN/Infinity and other stdlib extensions are rejected by orjson
+    return json.loads(data if isinstance(data, (str, bytes)) else bytes(data))
+
+
+# Files from this size on are memory-mapped instead of being read into a bytes object
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _read_json_file(path: Path) -> Any:
+    """Parse a JSON file. Large files are memory-mapped and handed to orjson without an intermediate copy."""
+    if not orjson or path.stat().st_size < _MMAP_THRESHOLD:
+        return _loads(path.read_bytes())
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        with memoryview(mapped) as view:
+            return _loads(view)
+
+
+@lru_cache(maxsize=128)
+def _load_json_file_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON file. `mtime_ns` and `size` only take part in the cache key, so edited files are re-read."""
+    return _read_json_file(Path(path))
+
+
 def j_dumps(
     data: Dict | SimpleNamespace | List[Dict] | List[SimpleNamespace],
     file_path: Optional[Path] = None,
@@ -51,7 +132,8 @@ def j_dumps(
         data (Dict | SimpleNamespace | List[Dict] | List[SimpleNamespace]): JSON-compatible data or SimpleNamespace objects to dump.
         file_path (Optional[Path], optional): Path to the output file. If None, returns JSON as a dictionary. Defaults to None.
         ensure_ascii (bool, optional): If True, escapes non-ASCII characters in output. Defaults to True.
-        mode (str, optional): File open mode ('w' for overwrite, 'a' for append, 'a+' for merge). Defaults to 'w'.
+        mode (str, optional): File open mode ('w' for overwrite, 'a' for append, 'a+' for merge,
+            'jsonl' to append the data as one JSON Lines record without reading the file). Defaults to 'w'.
         exc_info (bool, optional): If True, logs exceptions with traceback. Defaults to True.
 
     Returns:
@@ -65,53 +147,209 @@ def j_dumps(
         {"key": "value"}
     """
     
-    path = Path(file_path) if isinstance(file_path, (str, Path)) else None
-    
-    def convert_to_dict(data):
-        """Convert SimpleNamespace instances to dictionaries recursively."""
-        if isinstance(data, SimpleNamespace):
-            return vars(data)
-        if isinstance(data, list):
-            return [convert_to_dict(item) for item in data]
-        if isinstance(data, dict):
-            return {key: convert_to_dict(value) for key, value in data.items()}
-        return data
+    if isinstance(file_path, Path):
+        path = file_path
+    else:
+        path = Path(file_path) if isinstance(file_path, str) else None
     
-    data = convert_to_dict(data)
+    def contains_ns(data) -> bool:
+        """Check whether a SimpleNamespace occurs anywhere in the data, stopping at the first one."""
+        stack = deque([data])
+        while stack:
+            node = stack.pop()
+            if isinstance(node, SimpleNamespace):
+                return True
+            if isinstance(node, dict):
+                stack.extend(v for v in node.values() if isinstance(v, (dict, list, SimpleNamespace)))
+            elif isinstance(node, list):
+                stack.extend(v for v in node if isinstance(v, (dict, list, SimpleNamespace)))
+        return False
 
-    if mode not in {"w", "a", "a+"}:
-        raise ValueError(f"Unsupported file mode '{mode}'. Use 'w', 'a', or 'a+'.")
+    def convert_to_dict(data):
+        """Convert SimpleNamespace instances to dictionaries using an explicit stack."""
+        if not contains_ns(data):
+            return data
+        root = [data]
+        stack = deque([(root, 0, data)])
+        while stack:
+            parent, key, value = stack.pop()
+            if isinstance(value, SimpleNamespace):
+                value = vars(value)
+            # dict()/list() copy a container at its final size in one C call and the children
+            # are then replaced in place, so the output never goes through incremental growth
+            if isinstance(value, dict):
+                value = dict(value)
+                stack.extend((value, k, v) for k, v in value.items() if isinstance(v, (dict, list, SimpleNamespace)))
+            elif isinstance(value, list):
+                value = list(value)
+                stack.extend((value, i, v) for i, v in enumerate(value) if isinstance(v, (dict, list, SimpleNamespace)))
+            parent[key] = value
+        return root[0]
+
+    if mode not in {"w", "a", "a+", "jsonl"}:
+        raise ValueError(f"Unsupported file mode '{mode}'. Use 'w', 'a', 'a+' or 'jsonl'.")
 
     if path and mode in {"a", "a+"}:
+        data = convert_to_dict(data)
         try:
             existing_data = j_loads(path)
-            if existing_data:
-                if mode == "a+":
-                    data.update(existing_data)
-                else:
-                    existing_data.update(data)
-                    data = existing_data
         except Exception as ex:
             logger.error(f"Error reading {path=}: {ex}", exc_info=exc_info)
             return
+        if existing_data:
+            # `|` and `+` build the merged container in C without modifying either input;
+            # 'a' lets the new data win, 'a+' keeps the existing values
+            if isinstance(data, dict) and isinstance(existing_data, dict):
+                data = data | existing_data if mode == "a+" else existing_data | data
+            elif isinstance(data, list) and isinstance(existing_data, list):
+                data = data + existing_data if mode == "a+" else existing_data + data
+            else:
+                logger.error(f"Cannot merge {type(data).__name__} with {type(existing_data).__name__} from {path}", exc_info=False)
+                return
 
     if path:
         try:
             path.parent.mkdir(parents=True, exist_ok=True)
-            with path.open(mode, encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=ensure_ascii)
+            # SimpleNamespace objects are converted by the encoder, so no converted copy
+            # of the tree is held in memory while writing
+            if mode == "jsonl":
+                _dump(data, path, "a", ensure_ascii, line=True)
+            else:
+                # Appending and merging rewrite the whole file with the merged document
+                _dump(data, path, "w", ensure_ascii)
         except Exception as ex:
             logger.error(f"Failed to write to {path}: {ex}", exc_info=exc_info)
             return
-    else:
+
+    return convert_to_dict(data)
+
+def clean_string(json_string: str) -> str:
+    """Remove triple backticks and 'json' from the beginning and end of the string."""
+    if json_string.startswith(("```", "```json")) and json_string.endswith("```"):
+        return json_string.strip("`").replace("json", "", 1).strip()
+    return json_string
+
+
+def merge_dicts(dict_list: list[dict]) -> dict:
+    """Merge a list of dictionaries into a single dictionary if they have the same structure."""
+    merged = dict_list[0]
+    for d in dict_list[1:]:
+        common = merged.keys() & d.keys()
+        # Only keys holding containers need the type-aware merge, the rest are overwritten in one update
+        nested = {key for key in common if isinstance(merged[key], (dict, list))}
+        merged.update({key: d[key] for key in common - nested})
+        for key in nested:
+            if isinstance(merged[key], dict) and isinstance(d[key], dict):
+                merged[key] = merge_dicts([merged[key], d[key]])
+            elif isinstance(merged[key], list) and isinstance(d[key], list):
+                merged[key].extend(d[key])
+            else:
+                merged[key] = d[key]
+    return merged
+
+
+def _load_csv_from_file(file_path: Path, exc_info: bool = True, cached: bool = False) -> list[dict]:
+    """Load data from a CSV file and return as a list of dictionaries."""
+    try:
+        with file_path.open("r", newline="", encoding="utf-8") as f:
+            return list(csv.DictReader(f))
+    except Exception as ex:
+        logger.error(f"Error reading CSV file: {file_path}", exc_info=exc_info)
+        return []
+
+
+def _load_json_file(json_path: Path, exc_info: bool = True, cached: bool = False) -> Any:
+    """Load a single JSON file, optionally through the LRU cache."""
+    try:
+        if cached:
+            stat = json_path.stat()
+            return _load_json_file_cached(str(json_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        data = _read_json_file(json_path)
         return data
-    
-    return data
+    except Exception as ex:
+        logger.debug(f"Error reading file {json_path=}", ex, exc_info=exc_info)
+        ...
+        return
+
+
+def _load_dir(json_path: Path, ordered: bool, exc_info: bool, cached: bool) -> Any:
+    """Load all JSON files of a directory and merge them when they are all dictionaries."""
+    # DirEntry caches the file type from the directory listing, so no per-file stat is needed
+    with os.scandir(json_path) as entries:
+        json_files = [Path(entry.path) for entry in entries if entry.name.endswith(".json") and entry.is_file()]
+    if not json_files: 
+        logger.warning(f"No JSON files found in directory: {json_path}", exc_info=True)
+        return
+
+    # File reads and parsing release the GIL often enough for threads to overlap them
+    with ThreadPoolExecutor(max_workers=min(32, len(json_files))) as executor:
+        loaded = executor.map(partial(j_loads, ordered=ordered, exc_info=exc_info, cached=cached), json_files)
+        dict_list = [d for d in loaded if d]
+    if dict_list and all(isinstance(d, dict) for d in dict_list):
+        if cached:
+            # merge_dicts updates the first dict and extends its lists in place; cached objects must stay untouched
+            dict_list = copy.deepcopy(dict_list)
+        return merge_dicts(dict_list)
+    return dict_list
+
+
+def _load_jsonl_file(jsonl_path: Path, exc_info: bool = True, cached: bool = False) -> list:
+    """Load a JSON Lines file as a list with one item per non-empty line."""
+    try:
+        with jsonl_path.open("rb") as f:
+            return [_loads(line) for line in f if line.strip()]
+    except Exception as ex:
+        logger.debug(f"Error reading file {jsonl_path=}", ex, exc_info=exc_info)
+        ...
+        return
+
+
+_SUFFIX_LOADERS = {".csv": _load_csv_from_file, ".jsonl": _load_jsonl_file}
+
+
+def _load_path(json_path: Path, ordered: bool, exc_info: bool, cached: bool) -> Any:
+    """Load a directory, a CSV file or a JSON file; unknown suffixes are read as JSON."""
+    if json_path.is_dir():
+        return _load_dir(json_path, ordered, exc_info, cached)
+    loader = _SUFFIX_LOADERS.get(json_path.suffix.lower(), _load_json_file)
+    return loader(json_path, exc_info, cached)
+
+
+def _load_str(jjson: str, ordered: bool, exc_info: bool, cached: bool) -> Any:
+    """Parse a JSON string, trying to repair it when it is malformed."""
+    data = clean_string(jjson)
+    try:
+        data = _loads(data)
+        return data
+    except Exception as ex:
+        data = repair_json(data)
+        try: 
+            data = _loads(data)
+            return data
+        except Exception as ex:
+            logger.debug(f"Invalid JSON format {data}", exc_info=exc_info)
+            return
+
+
+def _load_dict(jjson: dict, ordered: bool, exc_info: bool, cached: bool) -> dict:
+    """Dictionaries are already loaded."""
+    return jjson
+
+
+# `type(jjson)` -> loader; `type(Path())` is the concrete PosixPath/WindowsPath class
+_LOADERS = {
+    type(Path()): _load_path,
+    Path: _load_path,
+    str: _load_str,
+    dict: _load_dict,
+}
+
 
 def j_loads(
     jjson: dict | SimpleNamespace | str | Path | list[dict] | list[SimpleNamespace],
     ordered: bool = True,
-    exc_info: bool = True
+    exc_info: bool = True,
+    cached: bool = False,
 ) -> Any:
     """Load JSON or CSV data from a file, directory, or string.
 
@@ -119,6 +357,8 @@ def j_loads(
         jjson (Path | dict | str): Path to a file, directory, JSON data as a string, or JSON object.
         ordered (bool, optional): If True, returns OrderedDict to preserve element order. Defaults to False.
         exc_info (bool, optional): If True, logs exceptions with traceback. Defaults to True.
+        cached (bool, optional): If True, JSON files are served from an LRU cache keyed on path, mtime and size.
+            The cached objects are shared between callers and must not be modified. Defaults to False.
 
     Returns:
         Any: A dictionary or list of dictionaries if successful, or nothing if an error occurs.
@@ -140,78 +380,16 @@ def j_loads(
         >>> j_loads(Path('/path/to/file.csv'))
         [{'column1': 'value1', 'column2': 'value2'}]
     """
-    
-    def clean_string(json_string: str) -> str:
-        """Remove triple backticks and 'json' from the beginning and end of the string."""
-        if json_string.startswith(("```", "```json")) and json_string.endswith("```"):
-            return json_string.strip("`").replace("json", "", 1).strip()
-        return json_string
-
-    def merge_dicts(dict_list: list[dict]) -> dict:
-        """Merge a list of dictionaries into a single dictionary if they have the same structure."""
-        merged = dict_list[0]
-        for d in dict_list[1:]:
-            for key in merged.keys():
-                if key in d:
-                    if isinstance(merged[key], dict) and isinstance(d[key], dict):
-                        merged[key] = merge_dicts([merged[key], d[key]])
-                    elif isinstance(merged[key], list) and isinstance(d[key], list):
-                        merged[key].extend(d[key])
-                    else:
-                        merged[key] = d[key]
-        return merged
-
-    def _load_csv_from_file(file_path: Path) -> list[dict]:
-        """Load data from a CSV file and return as a list of dictionaries."""
-        try:
-            return pd.read_csv(file_path).to_dict(orient='records')
-        except Exception as ex:
-            logger.error(f"Error reading CSV file: {file_path}", exc_info=exc_info)
-            return []
-
-    try:
-        if isinstance(jjson, Path):
-            json_path = Path(jjson)
-            if json_path.is_dir():
-                json_files = list(json_path.glob("*.json"))
-                if not json_files: 
-                    logger.warning(f"No JSON files found in directory: {json_path}", exc_info=True)
-                    return
-
-                dict_list = [j_loads(file)[1] for file in json_files if j_loads(file)[0]]
-                if all(isinstance(d, dict) for d in dict_list):
-                    return merge_dicts(dict_list)
-                return dict_list
-
-            if json_path.suffix.lower() == ".csv":
-                csv_data = _load_csv_from_file(json_path)
-                return csv_data
-
-            try:
-                data = json.loads(json_path.read_text(encoding="utf-8"))
-                return data
-            except Exception as ex:
-                logger.debug(f"Error reading file {json_path=}", ex, exc_info=exc_info)
-                ...
-                return
 
-        elif isinstance(jjson, str):
-            data = clean_string(jjson)
-            try:
-                data = json.loads(data)
-                return data
-            except Exception as ex:
-                data = repair_json(data)  # Assuming repair_json is defined elsewhere
-                try: 
-                    data = json.loads(data)
-                    return data
-                except Exception as ex:
-                    logger.debug(f"Invalid JSON format {data}", exc_info=exc_info)
-                    return
-
-        elif isinstance(jjson, dict):
-            return jjson
+    handler = _LOADERS.get(type(jjson))
+    if handler is None:
+        # Subclasses such as OrderedDict take the slower isinstance route
+        handler = next((h for t, h in _LOADERS.items() if isinstance(jjson, t)), None)
+        if handler is None:
+            return
 
+    try:
+        return handler(jjson, ordered, exc_info, cached)
     except FileNotFoundError as ex:
         logger.error(f"File not found: {jjson}", exc_info=exc_info)
         return
@@ -219,8 +397,6 @@ def j_loads(
         logger.error(f"Error loading JSON data from {jjson}", exc_info=exc_info)
         return
 
-    return
-
 def j_loads_ns(
     jjson: Path | SimpleNamespace | Dict | str,
     ordered: bool = True,
@@ -258,7 +434,7 @@ def j_loads_ns(
 
 def replace_key_in_json(data, old_key, new_key) -> dict:
     """
-    Recursively replaces a key in a dictionary or list.
+    Replaces a key in a dictionary or list at every nesting level.
     
     Args:
         data (dict | list): The dictionary or list where key replacement occurs.
@@ -293,39 +469,74 @@ def replace_key_in_json(data, old_key, new_key) -> dict:
         # updated_data becomes {"outer": [{"inner": {"new_key": "value"}}]}
 
     """
-    if isinstance(data, dict):
-        for key in list(data.keys()):
-            if key == old_key:
-                data[new_key] = data.pop(old_key)
-            if isinstance(data[key], (dict, list)):
-                replace_key_in_json(data[key], old_key, new_key)
-    elif isinstance(data, list):
-        for item in data:
-            replace_key_in_json(item, old_key, new_key)
-    
+    # Walk the tree with an explicit stack: deep structures cannot hit the recursion limit
+    stack = deque([data])
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if old_key in node:
+                node[new_key] = node.pop(old_key)
+            stack.extend(value for value in node.values() if isinstance(value, (dict, list)))
+        elif isinstance(node, list):
+            stack.extend(item for item in node if isinstance(item, (dict, list)))
+
     return data
 
+def _rename_name_key(obj: dict) -> dict:
+    """`object_hook` для `process_json_file`: заменяет ключ `name` на `category_name` во время разбора."""
+    if 'name' in obj:
+        return {('category_name' if key == 'name' else key): value for key, value in obj.items()}
+    return obj
+
 def process_json_file(json_file: Path):
     """
     Обрабатывает JSON файл, заменяя ключ `name` на `category_name`.
+    Замена выполняется при разборе файла, без отдельного обхода дерева.
     @param json_file: Путь к JSON файлу.
     """
     try:
-        data = j_loads(json_file.read_text())
-        replace_key_in_json(data, 'name', 'category_name')
-        json_file.write_text(j_dumps(data))
+        data = json.loads(json_file.read_bytes(), object_hook=_rename_name_key)
+        _dump(data, json_file, "w", ensure_ascii=True)
     except Exception as ex:
         logger.error(f"Error processing file: {json_file}", ex)
 
+def _scan_json_files(directory: Path) -> list[Path]:
+    """
+    Собирает все `*.json` файлы в дереве каталогов через `os.scandir`.
+    Тип записи берётся из `DirEntry`, без отдельного `stat` на каждый файл.
+    @param directory: Корневая директория.
+    """
+    json_files = []
+    stack = [os.fspath(directory)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.json') and entry.is_file():
+                    json_files.append(Path(entry.path))
+    return json_files
+
 def recursive_process_json_files(directory: Path):
     """
     Рекурсивно обходит папки и обрабатывает JSON файлы.
+    Сначала собирается полный список файлов, затем файлы обрабатываются параллельно в отдельных процессах.
     @param directory: Путь к директории, которую нужно обработать.
     """
-    for path in directory.rglob('*.json'):
-        if path.is_file():
+    json_files = _scan_json_files(directory)
+    if len(json_files) < 2:
+        # Запуск пула процессов не окупается для одного файла
+        for path in json_files:
             process_json_file(path)
-        
+        return
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(process_json_file, json_files, chunksize=16))
+
+
+# Compiled once: `re.search` with a pattern string goes through the re module cache on every call
+_JSON_FENCE_RE = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+
+
 def extract_json_from_string(md_string: str) -> str:
     """Extract JSON content from Markdown string between ```json and ``` markers.
 
@@ -336,7 +547,7 @@ def extract_json_from_string(md_string: str) -> str:
         str: The extracted JSON string or an empty string if not found.
     """
     try:
-        match = re.search(r'```json\s*(.*?)\s*```', md_string, re.DOTALL)
+        match = _JSON_FENCE_RE.search(md_string)
         if match:
             json_string = match.group(1).strip()
             return json_string
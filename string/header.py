@@ -6,5 +6,8 @@
 
 import sys,os
 from pathlib import Path
-__root__ : Path = os.getcwd() [:os.getcwd().rfind(r'hypotez')+7]
-sys.path.append (__root__)  
\ No newline at end of file
+_cwd = os.getcwd()
+_idx = _cwd.rfind(r'hypotez')
+__root__ : Path = _cwd[:_idx + 7] if _idx >= 0 else _cwd
+if __root__ not in sys.path:
+    sys.path.append(__root__)
@@ -0,0 +1,61 @@
+""" """
+## \file ../tests/test_convertors_cached.py
+# -*- coding: utf-8 -*-
+# /path/to/interpreter/python
+
+import pandas as pd
+import pytest
+
+from src.utils.convertors.csv import csv2dict
+from src.utils.convertors.xls import xls2dict
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    file_path = tmp_path / "people.csv"
+    file_path.write_text("name,age\nAlice,30\n", encoding="utf-8")
+    return file_path
+
+
+@pytest.fixture
+def xls_file(tmp_path):
+    file_path = tmp_path / "people.xlsx"
+    pd.DataFrame({"name": ["Alice"], "age": [30]}).to_excel(file_path, sheet_name="Sheet1", index=False)
+    return file_path
+
+
+def test_csv2dict_cached_returns_same_result(csv_file):
+    # Test that cached=True serves repeated reads from the cache
+    first = csv2dict(csv_file, cached=True)
+    assert first == {"data": [{"name": "Alice", "age": "30"}]}
+    assert csv2dict(str(csv_file), cached=True) is first
+    # Test that uncached reads still build a new result
+    assert csv2dict(csv_file) == first
+    assert csv2dict(csv_file) is not first
+
+
+def test_csv2dict_cached_rereads_changed_file(csv_file):
+    # Test that editing the file invalidates the cached result
+    assert csv2dict(csv_file, cached=True) == {"data": [{"name": "Alice", "age": "30"}]}
+    csv_file.write_text("name,age\nAlice,30\nBob,25\n", encoding="utf-8")
+    assert csv2dict(csv_file, cached=True) == {"data": [{"name": "Alice", "age": "30"}, {"name": "Bob", "age": "25"}]}
+
+
+def test_csv2dict_cached_missing_file(tmp_path):
+    # Test that a missing file falls through to the uncached read and returns None
+    assert csv2dict(tmp_path / "missing.csv", cached=True) is None
+
+
+def test_xls2dict_cached_returns_same_result(xls_file):
+    # Test that cached=True serves repeated reads from the cache
+    first = xls2dict(xls_file, cached=True)
+    assert first == {"Sheet1": [{"name": "Alice", "age": 30}]}
+    assert xls2dict(xls_file, cached=True) is first
+    assert xls2dict(xls_file) is not first
+
+
+def test_xls2dict_cached_rereads_changed_file(xls_file):
+    # Test that rewriting the workbook invalidates the cached result
+    assert xls2dict(xls_file, cached=True) == {"Sheet1": [{"name": "Alice", "age": 30}]}
+    pd.DataFrame({"name": ["Alice", "Bob"], "age": [30, 25]}).to_excel(xls_file, sheet_name="Sheet1", index=False)
+    assert xls2dict(xls_file, cached=True) == {"Sheet1": [{"name": "Alice", "age": 30}, {"name": "Bob", "age": 25}]}
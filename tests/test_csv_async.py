@@ -0,0 +1,65 @@
+""" """
+## \file ../tests/test_csv_async.py
+# -*- coding: utf-8 -*-
+# /path/to/interpreter/python
+
+import asyncio
+
+import pytest
+
+from src.utils.csv import save_csv_file, save_csv_file_async
+
+
+@pytest.fixture
+def rows():
+    return [{"name": "Alice", "age": "30"}, {"name": "Bob", "age": "25"}]
+
+
+def test_save_csv_file_async_matches_save_csv_file(tmp_path, rows):
+    # Test that the background write produces the same file as save_csv_file
+    sync_path = tmp_path / "sync.csv"
+    async_path = tmp_path / "nested" / "async.csv"
+    assert save_csv_file(rows, sync_path, mode="w") is True
+    assert save_csv_file_async(rows, async_path, mode="w").result(timeout=10) is True
+    assert async_path.read_bytes() == sync_path.read_bytes()
+
+
+def test_save_csv_file_async_appends_in_order(tmp_path, rows):
+    # Test that several appends keep their order and write the header once
+    file_path = tmp_path / "people.csv"
+    futures = [save_csv_file_async([row], file_path) for row in rows * 3]
+    assert [future.result(timeout=10) for future in futures] == [True] * 6
+    lines = file_path.read_text(encoding="utf-8").splitlines()
+    assert lines == ["name,age"] + ["Alice,30", "Bob,25"] * 3
+
+
+def test_save_csv_file_async_data_can_change_after_call(tmp_path, rows):
+    # Test that rows are serialized before the call returns
+    file_path = tmp_path / "people.csv"
+    future = save_csv_file_async(rows, file_path, mode="w")
+    rows[0]["name"] = "Changed"
+    rows.clear()
+    assert future.result(timeout=10) is True
+    assert file_path.read_text(encoding="utf-8").splitlines() == ["name,age", "Alice,30", "Bob,25"]
+
+
+def test_save_csv_file_async_empty_data(tmp_path):
+    # Test that empty data resolves to True at once and creates no file
+    file_path = tmp_path / "empty.csv"
+    future = save_csv_file_async([], file_path)
+    assert future.done() and future.result() is True
+    assert not file_path.exists()
+
+
+def test_save_csv_file_async_invalid_rows(tmp_path):
+    # Test that rows with unknown columns resolve to False
+    file_path = tmp_path / "bad.csv"
+    assert save_csv_file_async([{"a": "1"}, {"b": "2"}], file_path, exc_info=False).result(timeout=10) is False
+
+
+@pytest.mark.asyncio
+async def test_save_csv_file_async_awaitable(tmp_path, rows):
+    # Test awaiting the future from a coroutine
+    file_path = tmp_path / "people.csv"
+    assert await asyncio.wrap_future(save_csv_file_async(rows, file_path, mode="w")) is True
+    assert file_path.read_text(encoding="utf-8").splitlines()[0] == "name,age"
@@ -0,0 +1,65 @@
+""" """
+## \file ../tests/test_csv_engines.py
+# -*- coding: utf-8 -*-
+# /path/to/interpreter/python
+
+import csv as std_csv
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils import csv as csv_module
+from src.utils.csv import read_csv_file
+
+RAGGED = "name,age,city\nAlice,30,Paris\n\nBob,25\nCarol,41,Oslo,extra,more\n"
+
+
+@pytest.fixture
+def ragged_csv(tmp_path):
+    file_path = tmp_path / "ragged.csv"
+    file_path.write_text(RAGGED, encoding="utf-8")
+    return file_path
+
+
+@pytest.fixture
+def fake_cisv(monkeypatch):
+    # cisv returns the parsed rows as a list of lists; the stdlib reader stands in for its tokenizer here
+    calls = []
+
+    def parse_file(path, parallel=False):
+        calls.append(parallel)
+        with open(path, newline="", encoding="utf-8") as f:
+            return list(std_csv.reader(f))
+
+    monkeypatch.setattr(csv_module, "cisv", SimpleNamespace(parse_file=parse_file))
+    return calls
+
+
+def test_read_csv_file_stdlib_ragged_rows(ragged_csv):
+    # Test that the stdlib engine matches csv.DictReader for blank, short and long rows
+    with open(ragged_csv, newline="", encoding="utf-8") as f:
+        expected = list(std_csv.DictReader(f))
+    assert read_csv_file(ragged_csv, engine="stdlib") == expected
+
+
+def test_read_csv_file_cisv_ragged_rows(ragged_csv, fake_cisv):
+    # Test that cisv rows are padded, collected under None and skipped when empty, like the stdlib engine
+    assert read_csv_file(ragged_csv, engine="cisv") == [
+        {"name": "Alice", "age": "30", "city": "Paris"},
+        {"name": "Bob", "age": "25", "city": None},
+        {"name": "Carol", "age": "41", "city": "Oslo", None: ["extra", "more"]},
+    ]
+    assert read_csv_file(ragged_csv, engine="cisv") == read_csv_file(ragged_csv, engine="stdlib")
+    # Small files are parsed without cisv's parallel mode
+    assert fake_cisv == [False, False]
+
+
+def test_read_csv_file_cisv_missing(ragged_csv, monkeypatch):
+    # Test that the cisv engine without the package logs and returns None
+    monkeypatch.setattr(csv_module, "cisv", None)
+    assert read_csv_file(ragged_csv, exc_info=False, engine="cisv") is None
+
+
+def test_read_csv_file_unknown_engine(ragged_csv):
+    # Test that an unknown engine name returns None
+    assert read_csv_file(ragged_csv, exc_info=False, engine="nope") is None
@@ -0,0 +1,51 @@
+""" """
+## \file ../tests/test_csv_lazy.py
+# -*- coding: utf-8 -*-
+# /path/to/interpreter/python
+
+import sys
+
+import pytest
+
+from src.utils.csv import read_csv_lazy
+
+pl = pytest.importorskip("polars")
+
+
+@pytest.fixture
+def csv_files(tmp_path):
+    # Two CSV files with the same columns
+    first = tmp_path / "people1.csv"
+    first.write_text("name,age,city\nAlice,30,Paris\nBob,25,Rome\n", encoding="utf-8")
+    second = tmp_path / "people2.csv"
+    second.write_text("name,age,city\nCarol,41,Oslo\n", encoding="utf-8")
+    return first, second
+
+
+def test_read_csv_lazy_returns_lazy_frame(csv_files):
+    # Test that the result is a LazyFrame that reads all rows when collected
+    frame = read_csv_lazy(csv_files[0])
+    assert isinstance(frame, pl.LazyFrame)
+    assert frame.collect().to_dicts() == [
+        {"name": "Alice", "age": 30, "city": "Paris"},
+        {"name": "Bob", "age": 25, "city": "Rome"},
+    ]
+
+
+def test_read_csv_lazy_columns_and_filter(csv_files):
+    # Test column selection together with a row filter
+    frame = read_csv_lazy(csv_files[0], columns=["name"], filter_expr=pl.col("age") > 26)
+    assert frame.collect().to_dicts() == [{"name": "Alice"}]
+
+
+def test_read_csv_lazy_several_files(csv_files, tmp_path):
+    # Test that a list of files and a glob pattern are read as one frame
+    expected = ["Alice", "Bob", "Carol"]
+    assert sorted(read_csv_lazy(list(csv_files), columns=["name"]).collect()["name"].to_list()) == expected
+    assert sorted(read_csv_lazy(tmp_path / "people*.csv", columns=["name"]).collect()["name"].to_list()) == expected
+
+
+def test_read_csv_lazy_without_polars(csv_files, monkeypatch):
+    # Test that None is returned when polars cannot be imported
+    monkeypatch.setitem(sys.modules, "polars", None)
+    assert read_csv_lazy(csv_files[0]) is None
@@ -0,0 +1,50 @@
+""" """
+## \file ../tests/test_dict2json.py
+# -*- coding: utf-8 -*-
+# /path/to/interpreter/python
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils.convertors import dict as dict_module
+from src.utils.convertors.dict import dict2json
+
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request, monkeypatch):
+    # Run every test with orjson (when installed) and with the stdlib fallback
+    if request.param == "orjson":
+        if dict_module.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(dict_module, "orjson", None)
+    return request.param
+
+
+def test_dict2json_dict(tmp_path, encoder):
+    # Test saving a plain dictionary with non-ASCII text and a non-string key
+    file_path = tmp_path / "data.json"
+    assert dict2json({"name": "Алиса", 1: [1, 2.5, None, True]}, file_path) is True
+    assert json.loads(file_path.read_text(encoding="utf-8")) == {"name": "Алиса", "1": [1, 2.5, None, True]}
+
+
+def test_dict2json_namespace(tmp_path, encoder):
+    # Test that nested SimpleNamespace objects are written as objects
+    file_path = tmp_path / "ns.json"
+    data = SimpleNamespace(user=SimpleNamespace(name="Bob", tags=[SimpleNamespace(id=1)]))
+    assert dict2json(data, file_path) is True
+    assert json.loads(file_path.read_text(encoding="utf-8")) == {"user": {"name": "Bob", "tags": [{"id": 1}]}}
+
+
+def test_dict2json_big_integer(tmp_path, encoder):
+    # Test that integers wider than 64 bits are still written
+    file_path = tmp_path / "big.json"
+    assert dict2json({"n": 2**70}, file_path) is True
+    assert json.loads(file_path.read_text(encoding="utf-8")) == {"n": 2**70}
+
+
+def test_dict2json_unwritable_path(tmp_path, encoder):
+    # Test that a path in a missing directory returns False
+    assert dict2json({"a": 1}, tmp_path / "missing" / "data.json") is False
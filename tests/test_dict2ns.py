@@ -0,0 +1,57 @@
+""" """
+## \file ../tests/test_dict2ns.py
+# -*- coding: utf-8 -*-
+# /path/to/interpreter/python
+
+import math
+
+import pytest
+
+from src.utils.convertors.dict import dict2ns
+
+
+def test_dict2ns_nested():
+    # Test conversion at every nesting level without modifying the input
+    data = {"a": {"b": [1, {"c": 2}]}}
+    ns = dict2ns(data)
+    assert ns.a.b[0] == 1
+    assert ns.a.b[1].c == 2
+    assert data == {"a": {"b": [1, {"c": 2}]}}
+
+
+def test_dict2ns_share_equal_identical_dicts():
+    # Test that identical flat dicts share one namespace with share_equal=True, and only then
+    rows = [{"a": 1, "b": "x", "c": None, "d": 1.5}, {"a": 1, "b": "x", "c": None, "d": 1.5}]
+    shared = dict2ns(rows, share_equal=True)
+    assert shared[0] is shared[1]
+    separate = dict2ns(rows)
+    assert separate[0] is not separate[1]
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ({"a": 0.0}, {"a": -0.0}),
+        ({"a": 1}, {"a": 1.0}),
+        ({"a": 1}, {"a": True}),
+        ({"a": (1,)}, {"a": (1.0,)}),
+        ({1: "x"}, {True: "x"}),
+    ],
+)
+def test_dict2ns_share_equal_keeps_distinct_values(first, second):
+    # Test that equal but different values never share a namespace, so each dict keeps its own values
+    ns_first, ns_second = dict2ns([first, second], share_equal=True)
+    assert ns_first is not ns_second
+    assert [(type(k), k, type(v), repr(v)) for k, v in vars(ns_first).items()] == [
+        (type(k), k, type(v), repr(v)) for k, v in first.items()
+    ]
+    assert [(type(k), k, type(v), repr(v)) for k, v in vars(ns_second).items()] == [
+        (type(k), k, type(v), repr(v)) for k, v in second.items()
+    ]
+
+
+def test_dict2ns_share_equal_negative_zero_sign():
+    # Test that the sign of -0.0 survives sharing
+    ns_first, ns_second = dict2ns([{"a": 0.0}, {"a": -0.0}], share_equal=True)
+    assert math.copysign(1, ns_first.a) == 1
+    assert math.copysign(1, ns_second.a) == -1
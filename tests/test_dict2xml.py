@@ -0,0 +1,54 @@
+""" """
+## \file ../tests/test_dict2xml.py
+# -*- coding: utf-8 -*-
+# /path/to/interpreter/python
+
+import pytest
+
+from src.utils.convertors.dict import dict2xml
+
+
+def test_dict2xml_declaration_and_nesting():
+    # Test the XML declaration, nested elements and list items
+    data = {"root": {"name": "Alice", "items": [1, 2.5]}}
+    assert dict2xml(data) == (
+        b'<?xml version="1.0" encoding="UTF-8"?>'
+        b"<root><name>Alice</name><items>1</items><items>2.5</items></root>"
+    )
+
+
+def test_dict2xml_empty_elements():
+    # Test that elements without children are written short, empty values as an open/close pair
+    assert dict2xml({"root": {"attrs": {"id": "1"}}}).endswith(b'<root id="1"/>')
+    assert dict2xml({"root": {"d": {}, "e": "", "n": None}}).endswith(b"<root><d/><e></e><n></n></root>")
+
+
+def test_dict2xml_escaping():
+    # Test minidom-style escaping: quotes in text become &quot;, newlines in attributes stay raw
+    data = {"root": {"t": 'say "hi" & <b>', "attrs": {"a": 'l1\nl2 "q"'}}}
+    assert dict2xml(data).endswith(b'<root a="l1\nl2 &quot;q&quot;"><t>say &quot;hi&quot; &amp; &lt;b&gt;</t></root>')
+
+
+def test_dict2xml_encoding():
+    # Test that characters outside the encoding become character references and None returns str
+    assert dict2xml({"r": "é"}, encoding="ascii") == b'<?xml version="1.0" encoding="ascii"?><r>&#233;</r>'
+    assert dict2xml({"r": "é"}, encoding=None) == '<?xml version="1.0" ?><r>é</r>'
+
+
+def test_dict2xml_list_root_keeps_first_item():
+    # Test that only the first element of a list-valued root is written
+    assert dict2xml({"root": [{"a": 1}, {"a": 2}]}).endswith(b"<root><a>1</a></root>")
+
+
+def test_dict2xml_list_root_skips_items_without_elements():
+    # Test that list items producing no element are skipped until one does
+    assert dict2xml({"root": [[], 0]}).endswith(b"<root>0</root>")
+    assert dict2xml({"root": [[[], []], [1, 2], 3]}).endswith(b"<root>1</root>")
+    with pytest.raises(IndexError):
+        dict2xml({"root": []})
+
+
+def test_dict2xml_multiple_roots():
+    # Test that more than one root node raises
+    with pytest.raises(Exception, match="Only one root node allowed"):
+        dict2xml({"a": 1, "b": 2})
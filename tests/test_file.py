@@ -0,0 +1,163 @@
+""" """
+## \file ../tests/test_file.py
+# -*- coding: utf-8 -*-
+# /path/to/interpreter/python
+
+import asyncio
+import json
+import os
+import types
+
+import pytest
+
+from src.utils.file import (
+    clear_listing_cache,
+    get_directory_names,
+    get_filenames,
+    iter_recursive_filepaths,
+    recursively_get_filepath,
+    save_text_file_async,
+)
+
+
+@pytest.fixture
+def listing_dir(tmp_path):
+    # Directory with mixed-case extensions and two subdirectories
+    for name in ("a.txt", "B.TXT", "c.py"):
+        (tmp_path / name).write_text(name, encoding="utf-8")
+    (tmp_path / "sub1").mkdir()
+    (tmp_path / "sub2").mkdir()
+    clear_listing_cache()
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_save_text_file_async_str(tmp_path):
+    # Test saving a string, creating the missing parent directories
+    file_path = tmp_path / "nested" / "dir" / "out.txt"
+    assert await save_text_file_async("Hello, World!", file_path) is True
+    assert file_path.read_text(encoding="utf-8") == "Hello, World!"
+
+
+@pytest.mark.asyncio
+async def test_save_text_file_async_list_and_dict(tmp_path):
+    # Test that lists are written one item per line and dicts as JSON
+    list_path = tmp_path / "lines.txt"
+    dict_path = tmp_path / "data.json"
+    assert await save_text_file_async(["a", 1], list_path) is True
+    assert await save_text_file_async({"key": "значение"}, dict_path) is True
+    assert list_path.read_text(encoding="utf-8") == "a\n1\n"
+    assert json.loads(dict_path.read_text(encoding="utf-8")) == {"key": "значение"}
+
+
+@pytest.mark.asyncio
+async def test_save_text_file_async_append(tmp_path):
+    # Test append mode
+    file_path = tmp_path / "log.txt"
+    await save_text_file_async("one\n", file_path)
+    await save_text_file_async("two\n", file_path, mode="a")
+    assert file_path.read_text(encoding="utf-8") == "one\ntwo\n"
+
+
+@pytest.mark.asyncio
+async def test_save_text_file_async_gather(tmp_path):
+    # Test saving many files concurrently
+    texts = [f"text {i}" for i in range(20)]
+    results = await asyncio.gather(*(save_text_file_async(text, tmp_path / f"{i}.txt") for i, text in enumerate(texts)))
+    assert results == [True] * 20
+    assert [(tmp_path / f"{i}.txt").read_text(encoding="utf-8") for i in range(20)] == texts
+
+
+@pytest.mark.asyncio
+async def test_save_text_file_async_failure(tmp_path):
+    # Test that a failed write returns False instead of raising
+    (tmp_path / "blocker").write_text("", encoding="utf-8")
+    assert await save_text_file_async("data", tmp_path / "blocker" / "out.txt", exc_info=False) is False
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_get_filenames_extensions(listing_dir, cached):
+    # Test extension filtering, matched case-insensitively, with and without the cache
+    assert sorted(get_filenames(listing_dir, cached=cached)) == ["B.TXT", "a.txt", "c.py"]
+    assert sorted(get_filenames(listing_dir, "*.txt", cached=cached)) == ["B.TXT", "a.txt"]
+    assert sorted(get_filenames(listing_dir, ["py", ".TXT"], cached=cached)) == ["B.TXT", "a.txt", "c.py"]
+
+
+def test_get_filenames_cached_sees_directory_changes(listing_dir):
+    # Test that adding a file changes the directory mtime and so refreshes the cached listing
+    before = get_filenames(listing_dir, "*.txt", cached=True)
+    before.append("not-in-cache.txt")  # callers get their own list
+    assert sorted(get_filenames(listing_dir, "*.txt", cached=True)) == ["B.TXT", "a.txt"]
+    stat = os.stat(listing_dir)
+    (listing_dir / "d.txt").write_text("d", encoding="utf-8")
+    os.utime(listing_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert sorted(get_filenames(listing_dir, "*.txt", cached=True)) == ["B.TXT", "a.txt", "d.txt"]
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_get_directory_names(listing_dir, cached):
+    # Test listing subdirectories, with and without the cache
+    assert sorted(get_directory_names(listing_dir, cached=cached)) == ["sub1", "sub2"]
+
+
+def test_clear_listing_cache(listing_dir):
+    # Test that a change that keeps the directory mtime is only seen after clearing the cache
+    stat = os.stat(listing_dir)
+    assert sorted(get_directory_names(listing_dir, cached=True)) == ["sub1", "sub2"]
+    assert sorted(get_filenames(listing_dir, "*.py", cached=True)) == ["c.py"]
+    (listing_dir / "sub3").mkdir()
+    (listing_dir / "e.py").write_text("e", encoding="utf-8")
+    os.utime(listing_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert sorted(get_directory_names(listing_dir, cached=True)) == ["sub1", "sub2"]
+    assert sorted(get_filenames(listing_dir, "*.py", cached=True)) == ["c.py"]
+    clear_listing_cache()
+    assert sorted(get_directory_names(listing_dir, cached=True)) == ["sub1", "sub2", "sub3"]
+    assert sorted(get_filenames(listing_dir, "*.py", cached=True)) == ["c.py", "e.py"]
+
+
+def test_get_filenames_missing_directory(tmp_path):
+    # Test that a missing directory gives an empty list, cached or not
+    assert get_filenames(tmp_path / "missing", exc_info=False) == []
+    assert get_filenames(tmp_path / "missing", exc_info=False, cached=True) == []
+
+
+@pytest.fixture
+def tree_dir(tmp_path):
+    # Nested tree: root/a.txt, root/notes.md, root/x/b.txt, root/x/y/c.rst, root/x/y/d.py
+    for relative in ("a.txt", "notes.md", "x/b.txt", "x/y/c.rst", "x/y/d.py"):
+        file_path = tmp_path / relative
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(relative, encoding="utf-8")
+    return tmp_path
+
+
+def _relative(paths, root):
+    return sorted(os.path.relpath(path, root).replace(os.sep, "/") for path in paths)
+
+
+def test_iter_recursive_filepaths_is_lazy(tree_dir):
+    # Test that paths are produced by a generator, one at a time
+    paths = iter_recursive_filepaths(tree_dir)
+    assert isinstance(paths, types.GeneratorType)
+    assert os.path.isfile(next(paths))
+
+
+def test_iter_recursive_filepaths_patterns(tree_dir):
+    # Test a single pattern, a list of patterns, and that a file matching several patterns is yielded once
+    assert _relative(iter_recursive_filepaths(tree_dir, "*.txt"), tree_dir) == ["a.txt", "x/b.txt"]
+    assert _relative(iter_recursive_filepaths(tree_dir, ["*.md", "d.*"]), tree_dir) == ["notes.md", "x/y/d.py"]
+    assert _relative(iter_recursive_filepaths(tree_dir, ["*.py", "d.py"]), tree_dir) == ["x/y/d.py"]
+    assert len(list(iter_recursive_filepaths(tree_dir))) == 5
+
+
+@pytest.mark.parametrize("max_workers", [None, 1, 4])
+def test_iter_recursive_filepaths_matches_recursively_get_filepath(tree_dir, max_workers):
+    # Test that the threaded walk and the list wrapper give the same files as the sequential walk
+    expected = _relative(iter_recursive_filepaths(tree_dir, "*"), tree_dir)
+    assert _relative(iter_recursive_filepaths(tree_dir, "*", max_workers), tree_dir) == expected
+    assert _relative(recursively_get_filepath(tree_dir, "*", max_workers=max_workers), tree_dir) == expected
+
+
+def test_iter_recursive_filepaths_missing_root(tmp_path):
+    # Test that a missing root directory yields nothing, like os.walk
+    assert list(iter_recursive_filepaths(tmp_path / "missing")) == []
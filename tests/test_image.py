@@ -0,0 +1,113 @@
+""" """
+## \file ../tests/test_image.py
+# -*- coding: utf-8 -*-
+# /path/to/interpreter/python
+
+from io import BytesIO
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from PIL import Image
+
+from src.utils.image import save_many_png_from_urls, save_png_from_path
+
+
+def _image_bytes(image_format: str, colour: str = "red") -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (4, 4), colour).save(buffer, image_format)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def png_bytes():
+    return _image_bytes("PNG")
+
+
+@pytest.fixture
+def jpeg_bytes():
+    return _image_bytes("JPEG", "blue")
+
+
+@pytest.fixture
+def image_app(png_bytes, jpeg_bytes):
+    # Local HTTP server: /a.png serves PNG data, /b.jpg JPEG data, everything else is 404
+    images = {"a.png": png_bytes, "b.jpg": jpeg_bytes}
+
+    async def handler(request):
+        name = request.match_info["name"]
+        if name not in images:
+            raise web.HTTPNotFound()
+        return web.Response(body=images[name])
+
+    app = web.Application()
+    app.router.add_get("/{name}", handler)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_save_many_png_from_urls(image_app, png_bytes, tmp_path):
+    # Test downloading several images over one session, results in input order
+    async with TestServer(image_app) as server:
+        pairs = [
+            (str(server.make_url("/a.png")), tmp_path / "a.png"),
+            (str(server.make_url("/b.jpg")), tmp_path / "nested" / "b.png"),
+        ]
+        results = await save_many_png_from_urls(pairs, limit=2)
+    assert results == [str(tmp_path / "a.png"), str(tmp_path / "nested" / "b.png")]
+    # PNG data is stored as downloaded, other formats are converted to PNG
+    assert (tmp_path / "a.png").read_bytes() == png_bytes
+    with Image.open(tmp_path / "nested" / "b.png") as img:
+        assert img.format == "PNG"
+        assert img.size == (4, 4)
+
+
+@pytest.mark.asyncio
+async def test_save_many_png_from_urls_failed_download(image_app, tmp_path):
+    # Test that a failed download gives None for its pair only
+    async with TestServer(image_app) as server:
+        pairs = [
+            (str(server.make_url("/missing.png")), tmp_path / "missing.png"),
+            (str(server.make_url("/a.png")), tmp_path / "a.png"),
+        ]
+        results = await save_many_png_from_urls(pairs)
+    assert results == [None, str(tmp_path / "a.png")]
+    assert not (tmp_path / "missing.png").exists()
+
+
+@pytest.mark.asyncio
+async def test_save_many_png_from_urls_empty():
+    # Test that no pairs give an empty list
+    assert await save_many_png_from_urls([]) == []
+
+
+@pytest.mark.asyncio
+async def test_save_png_from_path_copies_png(png_bytes, tmp_path):
+    # Test that a PNG source is copied byte for byte, creating the target directory
+    src_path = tmp_path / "src.png"
+    src_path.write_bytes(png_bytes)
+    target = tmp_path / "out" / "copy.png"
+    assert await save_png_from_path(src_path, target) == str(target)
+    assert target.read_bytes() == png_bytes
+
+
+@pytest.mark.asyncio
+async def test_save_png_from_path_converts_other_formats(jpeg_bytes, tmp_path):
+    # Test that a non-PNG source, even one named .png, is converted to PNG
+    src_path = tmp_path / "photo.png"
+    src_path.write_bytes(jpeg_bytes)
+    target = tmp_path / "converted.png"
+    assert await save_png_from_path(src_path, target) == str(target)
+    with Image.open(target) as img:
+        assert img.format == "PNG"
+        assert img.size == (4, 4)
+
+
+@pytest.mark.asyncio
+async def test_save_png_from_path_failures(tmp_path):
+    # Test that a missing source and data Pillow cannot read both return None
+    assert await save_png_from_path(tmp_path / "missing.png", tmp_path / "out.png") is None
+    broken = tmp_path / "broken.bin"
+    broken.write_bytes(b"not an image")
+    assert await save_png_from_path(broken, tmp_path / "out.png") is None
+    assert not (tmp_path / "out.png").exists()
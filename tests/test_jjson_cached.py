@@ -0,0 +1,45 @@
+""" """
+## \file ../tests/test_jjson_cached.py
+# -*- coding: utf-8 -*-
+# /path/to/interpreter/python
+import json
+import pytest
+from src.utils.jjson import j_loads
+
+
+@pytest.fixture
+def json_dir(tmp_path):
+    # Two files whose dictionaries are merged when the directory is loaded
+    (tmp_path / "a.json").write_text(json.dumps({"a": [1], "n": {"x": [1]}}), encoding="utf-8")
+    (tmp_path / "b.json").write_text(json.dumps({"a": [2], "n": {"x": [2]}}), encoding="utf-8")
+    return tmp_path
+
+
+def test_j_loads_cached_file_returns_same_data(json_dir):
+    # Test that a cached load returns the file contents on repeated calls
+    first = j_loads(json_dir / "a.json", cached=True)
+    second = j_loads(json_dir / "a.json", cached=True)
+    assert first == second == {"a": [1], "n": {"x": [1]}}
+
+
+def test_j_loads_cached_file_is_reloaded_after_change(json_dir):
+    # Test that the cache key follows the file's mtime and size
+    path = json_dir / "a.json"
+    assert j_loads(path, cached=True) == {"a": [1], "n": {"x": [1]}}
+    path.write_text(json.dumps({"a": [1, 2, 3]}), encoding="utf-8")
+    assert j_loads(path, cached=True) == {"a": [1, 2, 3]}
+
+
+def test_j_loads_cached_directory_twice(json_dir):
+    # Test that merging a directory does not modify the cached per-file objects
+    expected = j_loads(json_dir)
+    assert sorted(expected["a"]) == [1, 2]
+    assert sorted(expected["n"]["x"]) == [1, 2]
+
+    for _ in range(3):
+        merged = j_loads(json_dir, cached=True)
+        assert sorted(merged["a"]) == [1, 2]
+        assert sorted(merged["n"]["x"]) == [1, 2]
+
+    assert j_loads(json_dir / "a.json", cached=True) == {"a": [1], "n": {"x": [1]}}
+    assert j_loads(json_dir / "b.json", cached=True) == {"a": [2], "n": {"x": [2]}}
@@ -0,0 +1,64 @@
+""" """
+## \file ../tests/test_jjson_dumps.py
+# -*- coding: utf-8 -*-
+# /path/to/interpreter/python
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils.jjson import j_dumps, j_loads
+
+
+@pytest.fixture
+def json_file(tmp_path):
+    file_path = tmp_path / "data.json"
+    file_path.write_text(json.dumps({"a": 1, "b": 2}), encoding="utf-8")
+    return file_path
+
+
+def test_j_dumps_append_mode_new_values_win(json_file):
+    # Test that mode 'a' rewrites the file with the merged document, new values overriding old ones
+    result = j_dumps({"b": 3, "c": 4}, json_file, mode="a")
+    assert result == {"a": 1, "b": 3, "c": 4}
+    assert json.loads(json_file.read_text(encoding="utf-8")) == result
+
+
+def test_j_dumps_merge_mode_keeps_existing_values(json_file):
+    # Test that mode 'a+' keeps the existing values on conflicts
+    result = j_dumps({"b": 3, "c": 4}, json_file, mode="a+")
+    assert result == {"a": 1, "b": 2, "c": 4}
+    assert json.loads(json_file.read_text(encoding="utf-8")) == result
+
+
+def test_j_dumps_append_lists(tmp_path):
+    # Test list merging order for 'a' and 'a+'
+    file_path = tmp_path / "list.json"
+    j_dumps([1], file_path)
+    assert j_dumps([2], file_path, mode="a") == [1, 2]
+    assert j_dumps([0], file_path, mode="a+") == [0, 1, 2]
+    assert json.loads(file_path.read_text(encoding="utf-8")) == [0, 1, 2]
+
+
+def test_j_dumps_append_to_missing_file(tmp_path):
+    # Test that appending to a file that does not exist yet just writes the data
+    file_path = tmp_path / "nested" / "new.json"
+    assert j_dumps({"x": 1}, file_path, mode="a") == {"x": 1}
+    assert json.loads(file_path.read_text(encoding="utf-8")) == {"x": 1}
+
+
+def test_j_dumps_jsonl_appends_records(tmp_path):
+    # Test that mode 'jsonl' appends one line per call and j_loads reads the lines back as a list
+    file_path = tmp_path / "records.jsonl"
+    j_dumps({"id": 1}, file_path, mode="jsonl")
+    j_dumps(SimpleNamespace(id=2, tags=["x"]), file_path, mode="jsonl")
+    lines = file_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [{"id": 1}, {"id": 2, "tags": ["x"]}]
+    assert j_loads(file_path) == [{"id": 1}, {"id": 2, "tags": ["x"]}]
+
+
+def test_j_dumps_unsupported_mode(tmp_path):
+    # Test that an unknown mode raises ValueError
+    with pytest.raises(ValueError):
+        j_dumps({"a": 1}, tmp_path / "x.json", mode="x")
@@ -0,0 +1,27 @@
+""" """
+## \file ../tests/test_jjson_wide_int.py
+# -*- coding: utf-8 -*-
+# /path/to/interpreter/python
+
+import json
+
+import pytest
+
+from src.utils.jjson import j_loads
+
+
+@pytest.mark.parametrize("size", [10, 200_000])
+def test_j_loads_wide_integers_stay_exact(tmp_path, size):
+    # Test that integers wider than 64 bits come back as exact ints, for small and memory-mapped files
+    file_path = tmp_path / "wide.json"
+    file_path.write_text(json.dumps({"n": 2**70, "m": -(2**64), "pad": "x" * size}), encoding="utf-8")
+    data = j_loads(file_path)
+    assert data["n"] == 2**70 and type(data["n"]) is int
+    assert data["m"] == -(2**64)
+
+
+def test_j_loads_regular_numbers(tmp_path):
+    # Test that ordinary numbers and long digit strings are unaffected
+    file_path = tmp_path / "plain.json"
+    file_path.write_text(json.dumps({"i": 2**63 - 1, "f": 1.5, "s": "1" * 30}), encoding="utf-8")
+    assert j_loads(file_path) == {"i": 2**63 - 1, "f": 1.5, "s": "1" * 30}
@@ -0,0 +1,39 @@
+""" """
+## \file ../tests/test_ns2dict.py
+# -*- coding: utf-8 -*-
+# /path/to/interpreter/python
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils.convertors.ns import ns2dict
+
+
+def test_ns2dict_nested():
+    # Test that nested namespaces inside dicts and lists are converted and the source is left unchanged
+    inner = SimpleNamespace(w=2)
+    data = SimpleNamespace(a=SimpleNamespace(z=[1, {"q": inner}]), b="text")
+    assert ns2dict(data) == {"a": {"z": [1, {"q": {"w": 2}}]}, "b": "text"}
+    assert data.a.z[1]["q"] is inner
+
+
+def test_ns2dict_self_reference():
+    # Test that a namespace referencing itself converts to a dict referencing itself instead of looping
+    data = SimpleNamespace(x=1)
+    data.me = data
+    result = ns2dict(data)
+    assert result["x"] == 1
+    assert result["me"] is result
+
+
+def test_ns2dict_cyclic_list_and_shared_objects():
+    # Test that cyclic lists terminate and an object reached twice converts to one shared result
+    items = [1]
+    items.append(items)
+    shared = SimpleNamespace(v=3)
+    result = ns2dict(SimpleNamespace(items=items, first=shared, second={"again": shared}))
+    assert result["items"][0] == 1
+    assert result["items"][1] is result["items"]
+    assert result["first"] == {"v": 3}
+    assert result["second"]["again"] is result["first"]
@@ -0,0 +1,51 @@
+""" """
+## \file ../tests/test_webp2png.py
+# -*- coding: utf-8 -*-
+# /path/to/interpreter/python
+
+import pytest
+from PIL import Image
+
+from src.utils.convertors.webp2png import webp2png, webp2png_batch
+
+
+@pytest.fixture
+def webp_files(tmp_path):
+    # Two small WEBP images of different colours
+    paths = []
+    for index, colour in enumerate(("red", "blue")):
+        webp_path = tmp_path / f"image{index}.webp"
+        Image.new("RGB", (8, 4), colour).save(webp_path, "WEBP", lossless=True)
+        paths.append((str(webp_path), str(tmp_path / f"image{index}.png")))
+    return paths
+
+
+def test_webp2png(webp_files):
+    # Test converting a single image
+    webp_path, png_path = webp_files[0]
+    assert webp2png(webp_path, png_path, compress_level=9) is True
+    with Image.open(png_path) as img:
+        assert img.format == "PNG"
+        assert img.size == (8, 4)
+        assert img.convert("RGB").getpixel((0, 0)) == (255, 0, 0)
+
+
+def test_webp2png_batch(webp_files):
+    # Test that the batch converts every pair and returns results in input order
+    assert webp2png_batch(webp_files, max_workers=2) == [True, True]
+    for (_, png_path), colour in zip(webp_files, ((255, 0, 0), (0, 0, 255))):
+        with Image.open(png_path) as img:
+            assert img.format == "PNG"
+            assert img.convert("RGB").getpixel((0, 0)) == colour
+
+
+def test_webp2png_batch_reports_failures(webp_files, tmp_path):
+    # Test that a missing source gives False for its pair without stopping the others
+    pairs = [(str(tmp_path / "missing.webp"), str(tmp_path / "missing.png")), webp_files[1]]
+    assert webp2png_batch(pairs) == [False, True]
+    assert not (tmp_path / "missing.png").exists()
+
+
+def test_webp2png_batch_empty():
+    # Test that an empty batch returns an empty list
+    assert webp2png_batch([]) == []
@@ -0,0 +1,90 @@
+""" """
+## \file ../tests/test_xls_read.py
+# -*- coding: utf-8 -*-
+# /path/to/interpreter/python
+
+import json
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from src.utils import xls
+from src.utils.xls import read_xls_as_dict
+
+
+@pytest.fixture
+def sample_xls(tmp_path):
+    # Small workbook: integer and float columns, an empty cell, and a second sheet
+    file_path = tmp_path / "sample.xlsx"
+    people = pd.DataFrame({"Name": ["Alice", "Bob"], "Age": [25, 30], "Score": [1.5, 2.0]})
+    places = pd.DataFrame({"City": ["Paris", "Rome"], "Country": ["France", "Italy"]})
+    with pd.ExcelWriter(file_path) as writer:
+        people.to_excel(writer, sheet_name="Sheet1", index=False)
+        places.to_excel(writer, sheet_name="Sheet2", index=False)
+    return file_path
+
+
+@pytest.fixture(params=["calamine", "pandas"])
+def reader(request, monkeypatch):
+    # Run every test with both readers; without python-calamine only the pandas one is available
+    if request.param == "calamine":
+        if xls.CalamineWorkbook is None:
+            pytest.skip("python-calamine is not installed")
+    else:
+        monkeypatch.setattr(xls, "CalamineWorkbook", None)
+    return request.param
+
+
+def test_read_xls_as_dict_column_types(sample_xls, reader):
+    # Test that types are decided per column: integer columns are int, a float column stays float even for 2.0
+    data = read_xls_as_dict(sample_xls)
+    assert data["Sheet1"] == [
+        {"Name": "Alice", "Age": 25, "Score": 1.5},
+        {"Name": "Bob", "Age": 30, "Score": 2.0},
+    ]
+    assert [type(row["Age"]) for row in data["Sheet1"]] == [int, int]
+    assert [type(row["Score"]) for row in data["Sheet1"]] == [float, float]
+
+
+def test_read_xls_as_dict_duplicate_and_empty_headers(tmp_path, reader):
+    # Test that repeated and empty header cells are named as pandas does instead of overwriting columns
+    file_path = tmp_path / "headers.xlsx"
+    workbook = openpyxl.Workbook()
+    workbook.active.append(["a", "b", "a", None, "a.1"])
+    workbook.active.append([1, 1.5, "x", 3, 7])
+    workbook.save(file_path)
+    rows = read_xls_as_dict(file_path, sheet_name=0)
+    assert rows == [{"a": 1, "b": 1.5, "a.2": "x", "Unnamed: 3": 3, "a.1": 7}]
+    assert list(rows[0]) == ["a", "b", "a.2", "Unnamed: 3", "a.1"]
+
+
+def test_read_xls_as_dict_sheet_name_with_json_file(sample_xls, tmp_path, reader):
+    # Test that sheet_name is honoured when a JSON file is written as well
+    json_file = tmp_path / "sheet2.json"
+    data = read_xls_as_dict(sample_xls, json_file=json_file, sheet_name="Sheet2")
+    expected = [{"City": "Paris", "Country": "France"}, {"City": "Rome", "Country": "Italy"}]
+    assert data == expected
+    assert json.loads(json_file.read_text(encoding="utf-8")) == expected
+
+
+def test_read_xls_as_dict_sheet_index(sample_xls, reader):
+    # Test selecting a sheet by index
+    assert read_xls_as_dict(sample_xls, sheet_name=1)[0] == {"City": "Paris", "Country": "France"}
+
+
+def test_read_xls_as_dict_empty_cell_calamine(tmp_path):
+    # Test that the calamine reader maps empty cells to None
+    if xls.CalamineWorkbook is None:
+        pytest.skip("python-calamine is not installed")
+    file_path = tmp_path / "gaps.xlsx"
+    pd.DataFrame({"A": [1, None], "B": ["x", None], "C": ["y", "z"]}).to_excel(file_path, index=False)
+    rows = read_xls_as_dict(file_path, sheet_name=0)
+    assert rows == [{"A": 1.0, "B": "x", "C": "y"}, {"A": None, "B": None, "C": "z"}]
+    # An empty cell makes a numeric column float, as pandas' NaN does
+    assert type(rows[0]["A"]) is float
+
+
+def test_read_xls_as_dict_missing_file(tmp_path):
+    # Test that a missing workbook returns False
+    assert read_xls_as_dict(tmp_path / "missing.xlsx") is False
@@ -23,11 +23,126 @@ Examples:
     True
 """
 
-import pandas as pd
 import json
+from datetime import date, datetime
 from typing import List, Dict, Union
 from pathlib import Path
 
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _convert_cell(value):
+    """Map a calamine cell in a mixed-type column to what pandas returns: empty cells become None, integral floats int
+    and dates datetime."""
+    if value == '':
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)  # pandas keeps 25, not 25.0, in object columns
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return datetime(value.year, value.month, value.day)  # calamine gives midnight timestamps as date, pandas as Timestamp
+    return value
+
+def _convert_column(values: tuple) -> list:
+    """Convert one column of calamine cells with the type pandas gives the whole column.
+
+    calamine reports every number as float. In a column of numbers and booleans an empty cell makes every value
+    float (pandas: float64 with NaN, so 1.0 next to 1.5, and True as 1.0); without empty cells the values are int
+    when all are integral, float otherwise, and a column of booleans alone stays bool. Columns holding anything
+    else are object columns in pandas, where each cell keeps its own type. Empty cells become None.
+    """
+    blank = has_number = False
+    integral = True
+    for value in values:
+        if value == '':
+            blank = True
+        elif isinstance(value, bool):
+            pass
+        elif isinstance(value, (int, float)):
+            has_number = True
+            integral = integral and float(value).is_integer()
+        else:
+            return [_convert_cell(value) for value in values]
+    if blank:
+        return [None if value == '' else float(value) for value in values]
+    if not has_number:
+        return list(values)
+    if integral:
+        return [int(value) for value in values]
+    return [float(value) for value in values]
+
+def _column_names(headers: list) -> list:
+    """Name the columns as pandas' Excel reader does.
+
+    Empty header cells become 'Unnamed: <index>'; repeated names get '.1', '.2', ... suffixes that skip names
+    already present, named columns being numbered before unnamed ones, so no column overwrites another.
+    """
+    names = [_convert_cell(header) for header in headers]
+    unnamed = [index for index, name in enumerate(names) if name is None]
+    for index in unnamed:
+        names[index] = f"Unnamed: {index}"
+    counts = {}
+    for index in [index for index in range(len(names)) if index not in unnamed] + unnamed:
+        name = original = names[index]
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[original] = count + 1
+            name = f"{original}.{count}"
+            count = count + 1 if name in names else counts.get(name, 0)
+        names[index] = name
+        counts[name] = count + 1
+    return names
+
+def _read_sheets_calamine(xls_file: str, sheet_name: Union[str, int] = None) -> Union[Dict, List[Dict]]:
+    """Read sheets with python-calamine; the first row of a sheet holds the column names, cells are converted as pandas does."""
+    def records(sheet) -> List[Dict]:
+        # Leading empty rows and columns are kept, as in pandas, where an empty first row is the header
+        rows = sheet.to_python(skip_empty_area=False)
+        if not rows:
+            return []
+        headers, *body = rows
+        headers = _column_names(headers)
+        # Types are decided per column, so the rows are built from converted columns
+        columns = [_convert_column(column) for column in zip(*body)]
+        return [dict(zip(headers, row)) for row in zip(*columns)]
+
+    workbook = CalamineWorkbook.from_path(str(xls_file))
+    if sheet_name is None:
+        return {sheet: records(workbook.get_sheet_by_name(sheet)) for sheet in workbook.sheet_names}
+    if isinstance(sheet_name, int):
+        return records(workbook.get_sheet_by_index(sheet_name))
+    return records(workbook.get_sheet_by_name(sheet_name))
+
+def _read_sheets_pandas(xls_file: str, sheet_name: Union[str, int] = None) -> Union[Dict, List[Dict]]:
+    """Fallback reader used when python-calamine is not installed."""
+    import pandas as pd
+
+    with pd.ExcelFile(xls_file) as xls:
+        if sheet_name is None:
+            return {sheet: pd.read_excel(xls, sheet_name=sheet).to_dict(orient='records') for sheet in xls.sheet_names}
+        return pd.read_excel(xls, sheet_name=sheet_name).to_dict(orient='records')
+
+def _save_json(data: Union[Dict, List[Dict]], json_file: str) -> None:
+    """Write sheet data as JSON, with orjson when it is installed and can encode every value."""
+    if orjson:
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            payload = None  # e.g. integers wider than 64 bits - let the stdlib handle them
+        if payload is not None:
+            with open(json_file, 'wb') as f:
+                f.write(payload)
+            return
+    with open(json_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
+
 def read_xls_as_dict(
     xls_file: str,
     json_file: str = None,
@@ -49,25 +164,15 @@ def read_xls_as_dict(
         {'Sheet1': [{'column1': 'value1', 'column2': 'value2'}]}
     """
     try:
-        # Load the Excel file
-        xls = pd.ExcelFile(xls_file)
-        
-        if sheet_name is None:
-            # Convert all sheets to JSON
-            all_sheets_data = {}
-            for sheet in xls.sheet_names:
-                df = pd.read_excel(xls, sheet_name=sheet)
-                all_sheets_data[sheet] = df.to_dict(orient='records')
-            data_dict = all_sheets_data
+        if CalamineWorkbook:
+            # Rust reader: no pandas import and no DataFrame in between
+            data_dict = _read_sheets_calamine(xls_file, sheet_name)
         else:
-            # Convert specified sheet to JSON
-            df = pd.read_excel(xls, sheet_name=sheet_name)
-            data_dict = df.to_dict(orient='records')
+            data_dict = _read_sheets_pandas(xls_file, sheet_name)
 
         if json_file:
             # Save JSON to file if path is provided
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(data_dict, f, ensure_ascii=False, indent=4)
+            _save_json(data_dict, json_file)
         
         return data_dict
     
@@ -95,6 +200,8 @@ def save_xls_file(
         True
     """
     try:
+        import pandas as pd
+
         with pd.ExcelWriter(file_path, engine='xlsxwriter') as writer:
             for sheet_name, rows in data.items():
                 df = pd.DataFrame(rows)